@@ -2,17 +2,26 @@
 Docia CLI Commands
 
 Individual command modules for the CLI interface.
+Command modules are imported lazily, on first attribute access.
 """
 
-from .document_commands import add, list, remove, search
-from .query_commands import query, clear
-from .system_commands import stats, config
-from .interactive_commands import shell, start
+from docia.utils.lazy import lazy_exports
+
+# Command name -> module that defines it
+_COMMAND_MODULES = {
+    'add': '.document_commands',
+    'list_documents': '.document_commands',
+    'remove': '.document_commands',
+    'search': '.document_commands',
+    'query': '.query_commands',
+    'clear': '.query_commands',
+    'stats': '.system_commands',
+    'config': '.system_commands',
+    'shell': '.interactive_commands',
+    'start': '.interactive_commands',
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _COMMAND_MODULES)
 
 # Export all commands
-__all__ = [
-    'add', 'list', 'remove', 'search',
-    'query', 'clear',
-    'stats', 'config',
-    'shell', 'start'
-]
\ No newline at end of file
+__all__ = list(_COMMAND_MODULES)
@@ -5,8 +5,6 @@ Commands for adding, listing, removing, and searching documents.
 """
 
 import click
-from pathlib import Path
-from typing import Optional
 
 
 @click.command()
@@ -40,9 +38,9 @@ def add(ctx, file_path, name, id):
         sys.exit(1)
 
 
-@click.command()
+@click.command(name='list')
 @click.pass_context
-def list(ctx):
+def list_documents(ctx):
     """List all documents in the knowledge base"""
     docia_instance = ctx.obj['docia']
 
@@ -53,15 +51,15 @@ def list(ctx):
             click.echo("FOLDER: No documents found in knowledge base")
             return
 
-        click.echo(f"FOLDER: Found {len(documents)} document(s):")
-        click.echo()
-
+        lines = [f"FOLDER: Found {len(documents)} document(s):", ""]
         for doc_info in documents:
-            click.echo(f"DOC: {doc_info['name']}")
-            click.echo(f"   ID: {doc_info['id']}")
-            click.echo(f"   Pages: {doc_info.get('page_count', 0)}")
-            click.echo(f"   Added: {doc_info.get('created_at', 'Unknown')}")
-            click.echo()
+            lines.append(
+                f"DOC: {doc_info['name']}\n"
+                f"   ID: {doc_info['id']}\n"
+                f"   Pages: {doc_info.get('page_count', 0)}\n"
+                f"   Added: {doc_info.get('created_at', 'Unknown')}\n"
+            )
+        click.echo("\n".join(lines))
 
     except Exception as e:
         click.echo(f"ERROR: Failed to list documents: {e}", err=True)
@@ -70,28 +68,52 @@ def list(ctx):
 
 
 @click.command()
-@click.argument('document_id')
+@click.argument('document_ids', nargs=-1, required=True)
+@click.option('--yes', '-y', is_flag=True, help='Remove without asking for confirmation')
 @click.pass_context
-def remove(ctx, document_id):
-    """Remove a document from the knowledge base"""
+def remove(ctx, document_ids, yes):
+    """Remove one or more documents from the knowledge base"""
+    import asyncio
     docia_instance = ctx.obj['docia']
 
-    try:
-        # First, get document info for confirmation
-        document = docia_instance.get_document_sync(document_id)
-        if not document:
-            click.echo(f"ERROR: Document with ID '{document_id}' not found")
-            return
+    async def fetch_all(ids):
+        return await asyncio.gather(*(docia_instance.get_document(i) for i in ids))
 
-        click.echo(f"DELETE: Removing document: {document.name}")
+    async def delete_all(ids):
+        return await asyncio.gather(
+            *(docia_instance.delete_document(i) for i in ids),
+            return_exceptions=True
+        )
 
-        # Confirm deletion
-        if click.confirm("Are you sure you want to remove this document?"):
-            success = docia_instance.delete_document_sync(document_id)
-            if success:
-                click.echo("SUCCESS: Document removed successfully!")
+    try:
+        if not yes:
+            # Look up all documents at once for a single confirmation
+            documents = asyncio.run(fetch_all(document_ids))
+            found_ids = []
+            for document_id, document in zip(document_ids, documents):
+                if not document:
+                    click.echo(f"ERROR: Document with ID '{document_id}' not found")
+                    continue
+                click.echo(f"DELETE: Removing document: {document.name}")
+                found_ids.append(document_id)
+
+            if not found_ids:
+                return
+
+            prompt = ("Are you sure you want to remove this document?" if len(found_ids) == 1
+                      else f"Are you sure you want to remove these {len(found_ids)} documents?")
+            if not click.confirm(prompt):
+                return
+            document_ids = found_ids
+
+        results = asyncio.run(delete_all(document_ids))
+        for document_id, result in zip(document_ids, results):
+            if isinstance(result, Exception):
+                click.echo(f"ERROR: Failed to remove document {document_id}: {result}")
+            elif result:
+                click.echo(f"SUCCESS: Document {document_id} removed successfully!")
             else:
-                click.echo("ERROR: Failed to remove document")
+                click.echo(f"ERROR: Document with ID '{document_id}' not found")
 
     except Exception as e:
         click.echo(f"ERROR: Failed to remove document: {e}", err=True)
@@ -105,25 +127,29 @@ def remove(ctx, document_id):
 @click.pass_context
 def search(ctx, search_term, limit):
     """Search documents by name and content"""
+    import asyncio
     docia_instance = ctx.obj['docia']
 
+    async def stream_results():
+        count = 0
+        async for result in docia_instance.search_documents_stream(search_term, limit):
+            lines = [f"DOC: {result['name']}", f"   ID: {result['id']}"]
+            if result.get('summary'):
+                summary = result['summary'][:100] + "..." if len(result['summary']) > 100 else result['summary']
+                lines.append(f"   Summary: {summary}")
+            lines.append("")
+            click.echo("\n".join(lines))
+            count += 1
+        return count
+
     try:
-        results = docia_instance.search_documents_sync(search_term, limit)
+        count = asyncio.run(stream_results())
 
-        if not results:
+        if not count:
             click.echo(f"SEARCH: No documents found matching: {search_term}")
             return
 
-        click.echo(f"SEARCH: Found {len(results)} document(s) matching '{search_term}':")
-        click.echo()
-
-        for result in results:
-            click.echo(f"DOC: {result['name']}")
-            click.echo(f"   ID: {result['id']}")
-            if 'summary' in result and result['summary']:
-                summary = result['summary'][:100] + "..." if len(result['summary']) > 100 else result['summary']
-                click.echo(f"   Summary: {summary}")
-            click.echo()
+        click.echo(f"SEARCH: Found {count} document(s) matching '{search_term}'")
 
     except Exception as e:
         click.echo(f"ERROR: Search failed: {e}", err=True)
@@ -5,31 +5,44 @@ Commands for interactive shell interface.
 """
 
 import click
-import asyncio
 import sys
-from typing import List, Optional
-from datetime import datetime
+import time
+from collections import deque
+from functools import wraps
+from operator import itemgetter
+from typing import Deque, List, Optional, TYPE_CHECKING
 import os
-from pathlib import Path
 
-from docia.models.document import QueryMode
-from docia.models.agent import ConversationMessage
-from docia.models.planner import Task, TaskStatus, Plan
+# Heavier imports are deferred to the shell itself so that other CLI
+# commands don't pay for them at startup
+if TYPE_CHECKING:
+    from docia.models.agent import ConversationMessage
+    from docia.models.planner import Task, Plan
 
+# Inputs that leave the shell, with or without a leading '/'
+EXIT_COMMANDS = frozenset({'exit', 'quit'})
 
-class InteractiveShell:
-    """Interactive shell for Docia with enhanced UI"""
+# Keyed by TaskStatus values; TaskStatus is a str enum so members hash the same
+_TASK_STATUS_ICONS = {
+    "pending": "[ ]",
+    "in_progress": "[*]",
+    "completed": "[x]",
+    "cancelled": "[-]",
+    "failed": "[!]",
+    "skipped": "[s]"
+}
 
-    def __init__(self, docia_instance, cli_instance):
-        self.docia = docia_instance
-        self.cli = cli_instance
-        self.conversation_history: List[ConversationMessage] = []
-        self.current_plan: Optional[Plan] = None
-        self.current_tasks: List[Task] = []
-        self.show_tasks = True  # Always show tasks
-        self.running = True
-        self.mode = "add"  # Default is add mode
-        self.logo = r"""
+# Seconds that document listings are reused within the shell
+LISTING_CACHE_TTL = 2.0
+
+# Conversation messages kept in the shell (user + assistant per exchange)
+MAX_HISTORY_MESSAGES = 40
+
+# Columns shown per row by /list; every storage backend's listing provides these keys
+_DOCUMENT_ROW_FIELDS = itemgetter('name', 'id', 'page_count', 'status')
+
+
+LOGO = r"""
     ╔════════════════════════════════════════════════╗
     ║  ██████╗  ██████╗  ██████╗██╗ █████╗           ║
     ║  ██╔══██╗██╔═══██╗██╔════╝██║██╔══██╗          ║
@@ -42,19 +55,104 @@ class InteractiveShell:
     ╚════════════════════════════════════════════════╝
 """
 
+# Static shell text, joined once so each display is a single write
+_WELCOME_TEXT = "\n".join([
+    LOGO,
+    "",
+    "Welcome to Docia Interactive Shell",
+    "=" * 60,
+    "To get started, add documents to analyze:",
+    "  Type the path to a PDF or image file",
+    "  Or drag and drop files onto this window",
+    "",
+    "After adding documents, you can ask questions directly.",
+    "Type '/' for available commands.",
+    "",
+])
+
+_HELP_TEXT = "\n".join([
+    "Available commands:",
+    "  /                 - Show this command menu",
+    "  /add <file>       - Add a document",
+    "  /list             - List all documents",
+    "  /query <question> - Ask a question about your documents",
+    "  /clear            - Clear conversation history",
+    "  /history          - Show conversation history size",
+    "  /exit             - Exit the interactive shell",
+    "",
+])
+
+_MENU_TEXT = "\n".join([
+    "Commands:",
+    "  /add              - Switch to add document mode",
+    "  /query            - Switch to query mode",
+    "  /list             - List all documents",
+    "  /clear            - Clear conversation history",
+    "  /history          - Show conversation history size",
+    "  /exit             - Exit shell",
+    "",
+    "",
+])
+
+
+def _is_folder_input(text: str) -> bool:
+    """Check whether shell input names a folder, skipping the stat for obvious questions"""
+    if len(text) >= 260 or '?' in text or '\n' in text:
+        return False
+    return os.path.isdir(text)
+
+
+def _ttl_cache(ttl: float):
+    """Memoize a callable's results per positional arguments for ``ttl`` seconds"""
+    def decorator(fn):
+        entries = {}
+
+        @wraps(fn)
+        def wrapper(*args):
+            now = time.monotonic()
+            entry = entries.get(args)
+            if entry is None or entry[0] <= now:
+                entry = (now + ttl, fn(*args))
+                entries[args] = entry
+            return entry[1]
+
+        wrapper.cache_clear = entries.clear
+        return wrapper
+    return decorator
+
+
+class InteractiveShell:
+    """Interactive shell for Docia with enhanced UI"""
+
+    def __init__(self, docia_instance, cli_instance):
+        self.docia = docia_instance
+        self.cli = cli_instance
+        self.conversation_history: Deque["ConversationMessage"] = deque(maxlen=MAX_HISTORY_MESSAGES)
+        self.current_plan: Optional["Plan"] = None
+        self.current_tasks: List["Task"] = []
+        self.show_tasks = True  # Always show tasks
+        self.running = True
+        self._set_mode("add")  # Default is add mode
+        # Single event loop reused by every query so client connection pools persist
+        import asyncio
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        # Progress events are queued by the query and written by a renderer task
+        self._events: "asyncio.Queue" = asyncio.Queue()
+        self._answer_parts: List[str] = []
+        self._list_documents_cached = _ttl_cache(LISTING_CACHE_TTL)(self._list_documents_on_loop)
+        self._build_dispatch()
+        # Long-lived prompt_toolkit session (with input history) when available
+        try:
+            from prompt_toolkit import PromptSession
+            from prompt_toolkit.history import InMemoryHistory
+            self._session = PromptSession(history=InMemoryHistory())
+        except ImportError:
+            self._session = None
+
     def display_welcome(self):
         """Display welcome message with enhanced logo"""
-        click.echo(self.logo)
-        click.echo()
-        click.echo("Welcome to Docia Interactive Shell")
-        click.echo("=" * 60)
-        click.echo("To get started, add documents to analyze:")
-        click.echo("  Type the path to a PDF or image file")
-        click.echo("  Or drag and drop files onto this window")
-        click.echo()
-        click.echo("After adding documents, you can ask questions directly.")
-        click.echo("Type '/' for available commands.")
-        click.echo()
+        click.echo(_WELCOME_TEXT)
 
     def display_prompt(self):
         """Display the interactive prompt with enhanced styling"""
@@ -62,161 +160,210 @@ class InteractiveShell:
 
     def display_help(self):
         """Display help information"""
-        click.echo("Available commands:")
-        click.echo("  /                 - Show this command menu")
-        click.echo("  /add <file>       - Add a document")
-        click.echo("  /list             - List all documents")
-        click.echo("  /query <question> - Ask a question about your documents")
-        click.echo("  /clear            - Clear conversation history")
-        click.echo("  /exit             - Exit the interactive shell")
-        click.echo()
+        click.echo(_HELP_TEXT)
 
-    def display_tasks(self, tasks: List[Task]):
+    def display_tasks(self, tasks: List["Task"]):
         """Display current tasks from planner"""
         if not tasks:
             return
 
-        click.echo("Current Tasks:")
-        click.echo("-" * 30)
-        for i, task in enumerate(tasks, 1):
-            status_icon = self._get_task_status_icon(task.status)
-            click.echo(f"{i:2d}. {status_icon} {task.name}")
-            click.echo(f"     Type: {task.information_type}")
-        click.echo()
+        click.echo(self._format_tasks(tasks))
 
-    def display_help(self):
-        """Display help information"""
-        click.echo("Available commands:")
-        click.echo("  /                 - Show this command menu")
-        click.echo("  /add <file>       - Add a document")
-        click.echo("  /list             - List all documents")
-        click.echo("  /query <question> - Ask a question about your documents")
-        click.echo("  /clear            - Clear conversation history")
-        click.echo("  /exit             - Exit the interactive shell")
-        click.echo()
+    def _format_tasks(self, tasks: List["Task"]) -> str:
+        """Render the task list as a single block of text"""
+        lines = ["Current Tasks:", "-" * 30]
+        for i, task in enumerate(tasks, 1):
+            lines.append(f"{i:2d}. {_TASK_STATUS_ICONS.get(task.status, '[?]')} {task.name}")
+            lines.append(f"     Type: {task.information_type}")
+        lines.append("")
+        return "\n".join(lines)
 
     def display_command_menu(self):
         """Display quick command menu"""
-        click.echo("Commands:")
-        click.echo("  /add              - Switch to add document mode")
-        click.echo("  /query            - Switch to query mode")
-        click.echo("  /list             - List all documents")
-        click.echo("  /clear            - Clear conversation history")
-        click.echo("  /exit             - Exit shell")
-        click.echo()
-        click.echo(f"Current mode: {self.mode.upper()}")
-        click.echo()
+        click.echo(f"{_MENU_TEXT}Current mode: {self.mode.upper()}\n")
 
-    def _get_task_status_icon(self, status: TaskStatus) -> str:
-        """Get status icon for task"""
-        icons = {
-            TaskStatus.PENDING: "[ ]",
-            TaskStatus.IN_PROGRESS: "[*]",
-            TaskStatus.COMPLETED: "[x]",
-            TaskStatus.FAILED: "[!]",
-            TaskStatus.SKIPPED: "[s]"
-        }
+    async def progress_callback(self, event_type: str, data):
+        """Progress callback for real-time updates; queues the event for the renderer"""
+        self._events.put_nowait((event_type, data))
 
-    def progress_callback(self, event_type: str, data):
-        """Progress callback for real-time updates"""
+    def _format_progress_event(self, event_type: str, data) -> Optional[str]:
+        """Render a progress event as text, or None if nothing should be shown"""
         if event_type == 'plan_created':
             self.current_plan = data
             self.current_tasks = data.tasks
-            if self.show_tasks:
-                click.echo("Plan created:")
-                self.display_tasks(data.tasks)
+            if self.show_tasks and data.tasks:
+                return "Plan created:\n" + self._format_tasks(data.tasks)
 
         elif event_type == 'task_started':
             task = data.get('task')
             if task and self.show_tasks:
-                click.echo(f"Starting: {task.name}")
+                return f"Starting: {task.name}"
 
         elif event_type == 'task_completed':
             task = data.get('task')
             result = data.get('result')
             if task and self.show_tasks:
                 pages_analyzed = len(result.selected_pages) if result else 0
-                click.echo(f"Completed: {task.name} ({pages_analyzed} pages)")
+                return f"Completed: {task.name} ({pages_analyzed} pages)"
 
         elif event_type == 'pages_selected':
             pages = data.get('page_numbers', [])
             if self.show_tasks:
-                click.echo(f"Pages selected: {pages}")
+                return f"Pages selected: {pages}"
+
+        return None
+
+    async def _render_progress(self):
+        """Drain queued progress events, writing each available batch at once"""
+        while True:
+            events = [await self._events.get()]
+            while not self._events.empty():
+                events.append(self._events.get_nowait())
+
+            pieces = []
+            for event in events:
+                if event is None:
+                    continue
+                event_type, data = event
+                if event_type == 'answer_chunk':
+                    # Answer text streams in place, under the results header
+                    if not self._answer_parts:
+                        pieces.append(self._format_result_header("RESULTS:") + "\n")
+                    self._answer_parts.append(data['text'])
+                    pieces.append(data['text'])
+                else:
+                    text = self._format_progress_event(event_type, data)
+                    if text is not None:
+                        pieces.append(text + "\n")
+            if pieces:
+                click.echo("".join(pieces), nl=False)
+            if None in events:
+                return
+
+    async def _query_with_progress(self, **query_kwargs):
+        """Run a Docia query while a renderer task prints its progress events"""
+        import asyncio
+
+        self._answer_parts = []
+        renderer = asyncio.ensure_future(self._render_progress())
+        try:
+            return await self.docia.query(task_update_callback=self.progress_callback, **query_kwargs)
+        finally:
+            self._events.put_nowait(None)
+            await renderer
 
     async def process_query(self, query_text: str):
         """Process a query interactively"""
         try:
-            # Check if query is a folder path
-            if os.path.isdir(query_text.strip()):
-                folder_path = Path(query_text.strip())
-                click.echo(f"Processing folder: {folder_path}")
-                
-                # Add all supported files in the folder
-                supported_extensions = ['.pdf', '.jpg', '.jpeg', '.png']
-                added_documents = []
-                
-                for file_path in folder_path.iterdir():
-                    if file_path.suffix.lower() in supported_extensions:
-                        try:
-                            doc = self.docia.add_document(str(file_path))
-                            added_documents.append(doc)
-                            click.echo(f"  Added: {file_path.name}")
-                        except Exception as e:
-                            click.echo(f"  Failed to add {file_path.name}: {e}")
-                
-                if added_documents:
-                    click.echo(f"Added {len(added_documents)} documents from folder")
-                    query_text = f"Analyze all documents in the folder {folder_path.name}"
-                else:
-                    click.echo("No supported documents found in folder")
-                    return
-            
-            click.echo(f"Querying: {query_text}")
-            click.echo()
-
-            # Execute query with real-time updates
-            result = await self.docia.query(
-                question=query_text,
-                mode=QueryMode.AUTO,
-                document_ids=None,
-                max_pages=None,
-                conversation_history=self.conversation_history,
-                task_update_callback=self.progress_callback
-            )
+            query_text = await self._maybe_ingest_folder(query_text)
+            if query_text is not None:
+                await self._run_query(query_text)
+        except Exception as e:
+            click.echo(f"Error: Query failed: {e}", err=True)
 
-            # Display results
-            click.echo("" + "="*30)
-            click.echo("RESULTS:")
-            click.echo("="*30)
-            click.echo(result.answer)
-            click.echo()
-
-            # Display metadata
-            click.echo("Information:")
-            click.echo(f"   Time: {result.processing_time:.2f}s")
-            click.echo(f"   Pages: {result.page_count}")
-            click.echo(f"   Tasks: {result.metadata.get('tasks_completed', 0)}")
-
-            # Update conversation history
-            self.conversation_history.append(
-                ConversationMessage(role="user", content=query_text)
-            )
-            self.conversation_history.append(
-                ConversationMessage(role="assistant", content=result.answer)
+    async def _maybe_ingest_folder(self, text: str) -> Optional[str]:
+        """Add the documents of a folder given as input
+
+        Returns the text to query: unchanged when it is not a folder, a folder
+        analysis prompt after ingesting it, or None when nothing was added.
+        """
+        folder_path = text.strip()
+        if not _is_folder_input(folder_path):
+            return text
+
+        from docia.utils.folder_helpers import list_folder_files, ingest_files, folder_query_text
+
+        click.echo(f"Processing folder: {folder_path}")
+
+        # Advance a single progress bar as each file finishes; report failures after
+        file_paths = list_folder_files(folder_path)
+        with click.progressbar(length=len(file_paths), label='Adding documents', show_pos=True) as bar:
+            added_documents, failed = await ingest_files(
+                self.docia, file_paths, on_file_done=lambda path, error: bar.update(1)
             )
+        if failed:
+            click.echo("\n".join(f"  Failed to add {os.path.basename(path)}: {error}" for path, error in failed))
+
+        if not added_documents:
+            click.echo("No supported documents found in folder")
+            return None
+
+        self._invalidate_caches()
+        click.echo(f"Added {len(added_documents)} documents from folder")
+        return folder_query_text(folder_path)
+
+    async def _run_query(
+        self,
+        query_text: str,
+        *,
+        mode=None,
+        document_ids: Optional[List[str]] = None,
+        max_pages: Optional[int] = None,
+        use_history: bool = True,
+        heading: str = "RESULTS:"
+    ):
+        """Query with live progress, display the answer and record the exchange"""
+        from docia.models.document import QueryMode
+        from docia.models.agent import ConversationMessage
+
+        click.echo(f"Querying: {query_text}")
+        click.echo()
 
-            click.echo(f"Messages: {len(self.conversation_history)} messages")
+        # Execute query with real-time updates
+        result = await self._query_with_progress(
+            question=query_text,
+            mode=mode or QueryMode.AUTO,
+            document_ids=document_ids or None,
+            max_pages=max_pages,
+            conversation_history=list(self.conversation_history) if use_history else None
+        )
+
+        # Display results and metadata; a streamed answer is already on screen
+        streamed_answer = "".join(self._answer_parts)
+        if streamed_answer and streamed_answer.strip() == result.answer:
+            click.echo("\n\n" + self._format_result_info(result))
+        else:
+            click.echo(self._format_result(result, heading))
 
-        except Exception as e:
-            click.echo(f"Error: Query failed: {e}", err=True)
+        # Update conversation history
+        if use_history:
+            self.conversation_history.extend((
+                ConversationMessage(role="user", content=query_text),
+                ConversationMessage(role="assistant", content=result.answer)
+            ))
+            click.echo(f"Messages: {len(self.conversation_history)} messages")
 
     def run(self):
         """Run the interactive shell"""
         self.display_welcome()
-        self._run_basic_ui()
+        try:
+            self._run_basic_ui()
+        finally:
+            self._close_loop()
+
+    def _close_loop(self):
+        """Shut down the shell's event loop"""
+        if self._loop.is_closed():
+            return
+        import asyncio
+        try:
+            self._loop.run_until_complete(self._loop.shutdown_asyncgens())
+        finally:
+            asyncio.set_event_loop(None)
+            self._loop.close()
+
+    def _list_documents_on_loop(self):
+        """List documents on the shell's loop rather than a fresh one per call"""
+        return self._loop.run_until_complete(self.docia.list_documents())
+
+    def _read_input(self, prompt_text: str) -> str:
+        """Read one line of input, via prompt_toolkit on the shell's loop when installed"""
+        if self._session is None:
+            return click.prompt(prompt_text, default="", show_default=False)
+        return self._loop.run_until_complete(self._session.prompt_async(prompt_text))
 
     def _run_basic_ui(self):
-        """Run with basic UI using click.prompt"""
+        """Run with basic UI using prompt_toolkit or click.prompt"""
         # Display initial instructions
         click.echo("ADD MODE: Please add documents to get started.")
         click.echo("Enter file path or drag and drop files here.")
@@ -229,11 +376,11 @@ class InteractiveShell:
                     self.display_tasks(self.current_tasks)
                 
                 # Get user input
-                prompt_text = f"[{self.mode.upper()}] Docia > " if self.mode else "Docia > "
-                user_input = click.prompt(prompt_text, default="", show_default=False)
+                user_input = self._read_input(self._prompt_text)
+                stripped_input = user_input.strip()
 
                 # Handle empty input
-                if not user_input.strip():
+                if not stripped_input:
                     continue
 
                 # Handle commands with "/"
@@ -242,7 +389,7 @@ class InteractiveShell:
                     continue
 
                 # Handle exit command
-                if user_input.lower() in ['exit', 'quit']:
+                if stripped_input.lower() in EXIT_COMMANDS:
                     self.running = False
                     click.echo("\nGoodbye!")
                     break
@@ -250,15 +397,15 @@ class InteractiveShell:
                 # Process according to current mode
                 if self.mode == "add":
                     # In add mode, process as file path
-                    self._handle_add_command([user_input.strip()])
+                    self._handle_add_command([stripped_input])
                     # Switch to query mode after successfully adding file
-                    self.mode = "query"
+                    self._set_mode("query")
                     click.echo("\nSwitched to QUERY MODE. You can now ask questions about your documents.")
                     click.echo("Example: 'What is this document about?'")
                     click.echo()
                 else:
                     # In query mode, process as question
-                    asyncio.run(self.process_query(user_input))
+                    self._loop.run_until_complete(self.process_query(user_input))
 
             except click.exceptions.Abort:
                 # Handle Ctrl+C or terminal issues gracefully
@@ -281,27 +428,58 @@ class InteractiveShell:
             return
 
         # Parse command and arguments
-        parts = command.split()
-        cmd = parts[0].lower() if parts else ""
-        args = parts[1:] if len(parts) > 1 else []
-
-        # Handle specific commands
-        if cmd in ['exit', 'quit']:
-            self.running = False
-            click.echo("\nGoodbye!")
-        elif cmd == 'clear':
-            self.conversation_history.clear()
-            click.echo("Conversation history cleared")
-        elif cmd == 'list':
-            self._list_documents()
-        elif cmd == 'add':
-            self.mode = "add"
-            click.echo("Switched to ADD MODE. Enter file paths to add documents.")
-        elif cmd == 'query':
-            self.mode = "query"
-            click.echo("Switched to QUERY MODE. Enter your questions.")
-        else:
+        cmd, *args = command.split()
+        cmd = cmd.lower()
+
+        handler = self._slash_handlers.get(cmd)
+        if handler is None:
             click.echo(f"Unknown command: /{cmd}. Type / for available commands.")
+            return
+        handler(args)
+
+    def _build_dispatch(self):
+        """Map slash command names to their handlers"""
+        self._slash_handlers = {
+            **dict.fromkeys(EXIT_COMMANDS, self._cmd_exit),
+            'clear': self._cmd_clear,
+            'history': self._cmd_history,
+            'list': self._cmd_list,
+            'add': self._cmd_add_mode,
+            'query': self._cmd_query_mode,
+        }
+
+    def _set_mode(self, mode: str):
+        """Change the input mode and rebuild the prompt for it once"""
+        self.mode = mode
+        self._prompt_text = f"[{mode.upper()}] Docia > " if mode else "Docia > "
+
+    def _cmd_exit(self, args):
+        """Leave the shell"""
+        self.running = False
+        click.echo("\nGoodbye!")
+
+    def _cmd_clear(self, args):
+        """Clear conversation history"""
+        self.conversation_history.clear()
+        click.echo("Conversation history cleared")
+
+    def _cmd_history(self, args):
+        """Show conversation history size"""
+        click.echo(f"Conversation history: {len(self.conversation_history)}/{MAX_HISTORY_MESSAGES} messages")
+
+    def _cmd_list(self, args):
+        """List all documents"""
+        self._list_documents()
+
+    def _cmd_add_mode(self, args):
+        """Switch to add mode"""
+        self._set_mode("add")
+        click.echo("Switched to ADD MODE. Enter file paths to add documents.")
+
+    def _cmd_query_mode(self, args):
+        """Switch to query mode"""
+        self._set_mode("query")
+        click.echo("Switched to QUERY MODE. Enter your questions.")
 
     def _handle_add_command(self, args):
         """Handle the add command"""
@@ -312,12 +490,15 @@ class InteractiveShell:
             return
             
         try:
-            if not os.path.exists(file_path):
+            try:
+                os.stat(file_path)
+            except OSError:
                 click.echo(f"Error: File '{file_path}' not found")
                 return
                 
             click.echo(f"Adding document: {file_path}")
-            document = self.docia.add_document_sync(file_path=file_path)
+            document = self._loop.run_until_complete(self.docia.add_document(file_path=file_path))
+            self._invalidate_caches()
             click.echo(f"Document added successfully!")
             click.echo(f"   Name: {document.name}")
             click.echo(f"   ID: {document.id}")
@@ -325,79 +506,49 @@ class InteractiveShell:
         except Exception as e:
             click.echo(f"Failed to add document: {e}")
 
-    async def _async_query(self, query_text, document_ids, mode, max_pages, conversation):
-        """Async helper for processing queries"""
-        try:
-            click.echo(f"Querying: {query_text}")
-            click.echo()
-
-            # Convert mode string to enum
-            query_mode = QueryMode(mode)
-
-            # Execute query with progress tracking
-            result = await self.docia.query(
-                question=query_text,
-                mode=query_mode,
-                document_ids=document_ids if document_ids else None,
-                max_pages=max_pages,
-                conversation_history=self.conversation_history if conversation else None,
-                task_update_callback=self.progress_callback
-            )
-
-            # Display results
-            click.echo("Results:")
-            click.echo("=" * 30)
-            click.echo(result.answer)
-            click.echo()
-
-            # Display metadata
-            click.echo("Information:")
-            click.echo(f"   Time: {result.processing_time:.2f}s")
-            click.echo(f"   Pages: {result.page_count}")
-            click.echo(f"   Tasks: {result.metadata.get('tasks_completed', 0)}")
-
-            # Update conversation history if in conversation mode
-            if conversation:
-                self.conversation_history.append(
-                    ConversationMessage(role="user", content=query_text)
-                )
-                self.conversation_history.append(
-                    ConversationMessage(role="assistant", content=result.answer)
-                )
-                click.echo(f"Messages: {len(self.conversation_history)}")
-
-        except Exception as e:
-            click.echo(f"Query failed: {e}")
+    def _format_result_header(self, heading: str) -> str:
+        """Render the banner shown above a query answer"""
+        return "\n".join(["=" * 30, heading, "=" * 30])
+
+    def _format_result_info(self, result) -> str:
+        """Render query metadata as a single block of text"""
+        return "\n".join([
+            "Information:",
+            f"   Time: {result.processing_time:.2f}s",
+            f"   Pages: {result.page_count}",
+            f"   Tasks: {result.metadata.get('tasks_completed', 0)}",
+        ])
+
+    def _format_result(self, result, heading: str) -> str:
+        """Render a query answer and its metadata as a single block of text"""
+        return "\n".join([
+            self._format_result_header(heading),
+            result.answer,
+            "",
+            self._format_result_info(result),
+        ])
+
+    def _invalidate_caches(self):
+        """Drop cached listings after the document set changes"""
+        self._list_documents_cached.cache_clear()
 
     def _list_documents(self):
         """List all documents"""
         try:
-            documents = self.docia.list_documents_sync()
+            documents = self._list_documents_cached()
             if not documents:
                 click.echo("No documents found")
                 return
 
-            click.echo(f"Documents ({len(documents)}):")
-            click.echo("=" * 30)
-            for doc in documents:
-                pages_info = f"{doc.get('page_count', 0)} pages"
-                status = "Ready" if doc.get('status') == "completed" else "Processing"
-                click.echo(f"{doc.get('name')} ({doc.get('id')}) - {pages_info} [{status}]")
+            lines = [f"Documents ({len(documents)}):", "=" * 30]
+            lines.extend(
+                f"{name} ({doc_id}) - {pages} pages [{'Ready' if status == 'completed' else 'Processing'}]"
+                for name, doc_id, pages, status in map(_DOCUMENT_ROW_FIELDS, documents)
+            )
+            click.echo("\n".join(lines))
         except Exception as e:
             click.echo(f"Error listing documents: {e}")
 
-    def _show_stats(self):
-        """Show system statistics"""
-        try:
-            stats = self.docia.get_stats()
-            click.echo("System Statistics:")
-            click.echo("=" * 30)
-            click.echo(f"Documents: {stats.get('total_documents', 0)}")
-            click.echo(f"Queries: {stats.get('total_queries', 0)}")
-            click.echo(f"Time: {stats.get('avg_processing_time', 0):.2f}s")
-        except Exception as e:
-            click.echo(f"Error getting stats: {e}")
-
 
 @click.command()
 @click.pass_context
@@ -411,9 +562,11 @@ def shell(ctx):
         interactive_shell = InteractiveShell(docia_instance, cli_instance)
         interactive_shell.run()
     except Exception as e:
-        click.echo(f"ERROR: Failed to start interactive shell: {e}", err=True)
-        import traceback
-        traceback.print_exc()
+        if ctx.obj.get('debug'):
+            import traceback
+            click.echo(traceback.format_exc(), err=True)
+        else:
+            click.echo(f"ERROR: Failed to start interactive shell: {e}", err=True)
         sys.exit(1)
 
 
@@ -6,11 +6,6 @@ Commands for querying documents and managing conversations.
 
 import click
 import os
-from pathlib import Path
-from typing import List
-
-from docia.models.document import QueryMode
-from docia.models.agent import ConversationMessage
 
 
 @click.command()
@@ -22,31 +17,35 @@ from docia.models.agent import ConversationMessage
 @click.pass_context
 def query(ctx, query, document, mode, max_pages, conversation):
     """Query documents with intelligent analysis"""
+    import asyncio
+    from docia.models.document import QueryMode
+    from docia.models.agent import ConversationMessage
+
     docia_instance = ctx.obj['docia']
     cli_instance = ctx.obj['cli']
 
     try:
         # Check if query is a folder path
-        if os.path.isdir(query.strip()):
-            folder_path = Path(query.strip())
+        folder_path = query.strip()
+        if os.path.isdir(folder_path):
+            from docia.utils.folder_helpers import list_folder_files, ingest_files, folder_query_text
+
             click.echo(f"[DIR] Processing folder: {folder_path}")
-            
-            # Add all supported files in the folder
-            supported_extensions = ['.pdf', '.jpg', '.jpeg', '.png']
+
+            # Add all supported files in the folder concurrently
+            file_paths = list_folder_files(folder_path)
             added_documents = []
-            
-            for file_path in folder_path.iterdir():
-                if file_path.suffix.lower() in supported_extensions:
-                    try:
-                        doc = docia_instance.add_document(str(file_path))
-                        added_documents.append(doc)
-                        click.echo(f"  [OK] Added: {file_path.name}")
-                    except Exception as e:
-                        click.echo(f"  [ERR] Failed to add {file_path.name}: {e}")
-            
+            if file_paths:
+                with click.progressbar(length=len(file_paths), label='Adding documents', show_pos=True) as bar:
+                    added_documents, failed = asyncio.run(ingest_files(
+                        docia_instance, file_paths, on_file_done=lambda path, error: bar.update(1)
+                    ))
+                if failed:
+                    click.echo("\n".join(f"  [ERR] Failed to add {os.path.basename(path)}: {error}" for path, error in failed))
+
             if added_documents:
                 click.echo(f"[INFO] Added {len(added_documents)} documents from folder")
-                query = f"Analyze all documents in the folder {folder_path.name}"
+                query = folder_query_text(folder_path)
             else:
                 click.echo("[WARN] No supported documents found in folder")
                 return
@@ -5,8 +5,8 @@ Commands for system statistics and configuration management.
 """
 
 import click
-import json
-from pathlib import Path
+
+from docia.utils.json_helpers import json_dumps
 
 
 @click.command()
@@ -68,11 +68,10 @@ def show(ctx):
     try:
         from ..main import cli_instance
         if cli_instance.config_file.exists():
-            with open(cli_instance.config_file, 'r') as f:
-                config_data = json.load(f)
+            config_data = cli_instance.load_config_data()
 
             click.echo("CONFIG: Current Configuration:")
-            click.echo(json.dumps(config_data, indent=2))
+            click.echo(json_dumps(config_data, indent=True))
         else:
             click.echo("CONFIG: No configuration file found")
             click.echo("Using environment variables and defaults")
@@ -92,8 +91,7 @@ def set(ctx, provider, storage_path, max_iterations, log_level):
         from ..main import cli_instance
         # Load existing config or create new
         if cli_instance.config_file.exists():
-            with open(cli_instance.config_file, 'r') as f:
-                config_data = json.load(f)
+            config_data = cli_instance.load_config_data()
         else:
             config_data = {}
 
@@ -108,9 +106,7 @@ def set(ctx, provider, storage_path, max_iterations, log_level):
             config_data['log_level'] = log_level
 
         # Save config
-        cli_instance.config_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(cli_instance.config_file, 'w') as f:
-            json.dump(config_data, f, indent=2)
+        cli_instance.save_config_data(config_data)
 
         click.echo("SUCCESS: Configuration saved successfully!")
         click.echo(f"   Location: {cli_instance.config_file}")
@@ -5,65 +5,100 @@ Docia CLI - VisionLM Document Intelligence Tool
 A command-line interface for Docia's intelligent document analysis capabilities.
 """
 
-import asyncio
-import json
+import dataclasses
 import os
 import sys
 import click
 from pathlib import Path
-from typing import Optional, List
-from datetime import datetime
+from typing import Optional, List, Dict, Any, Tuple, TYPE_CHECKING
+
+_PROJECT_ROOT = Path(__file__).parent.parent
+
+# Default location of the saved CLI configuration
+CONFIG_FILE = Path.home() / ".docia" / "config.json"
+
 
 # Load environment variables from .env file
 def load_env_file():
     """Load environment variables from .env file"""
-    env_paths = [
+    env_paths = (
         Path.cwd() / ".env",  # Current directory
-        Path(__file__).parent.parent / ".env",  # Project root
-        Path(__file__).parent.parent / "docia" / ".env",  # Package directory
-    ]
+        _PROJECT_ROOT / ".env",  # Project root
+        _PROJECT_ROOT / "docia" / ".env",  # Package directory
+    )
 
     for env_path in env_paths:
-        if env_path.exists():
-            try:
-                with open(env_path, 'r', encoding='utf-8') as f:
-                    for line in f:
-                        line = line.strip()
-                        if line and not line.startswith('#') and '=' in line:
-                            key, value = line.split('=', 1)
-                            os.environ[key.strip()] = value.strip()
-            except UnicodeDecodeError:
-                # Fallback to different encoding if utf-8 fails
-                with open(env_path, 'r', encoding='latin-1') as f:
-                    for line in f:
-                        line = line.strip()
-                        if line and not line.startswith('#') and '=' in line:
-                            key, value = line.split('=', 1)
-                            os.environ[key.strip()] = value.strip()
+        try:
+            data = env_path.read_bytes()
+        except OSError:
+            continue
+        try:
+            text = data.decode('utf-8')
+        except UnicodeDecodeError:
+            # Fallback to different encoding if utf-8 fails
+            text = data.decode('latin-1')
+
+        for line in text.splitlines():
+            line = line.strip()
+            if line and not line.startswith('#') and '=' in line:
+                key, value = line.split('=', 1)
+                os.environ[key.strip()] = value.strip()
 
 # Load environment variables at module import
 load_env_file()
 
-# Add the parent directory to Python path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Use uvloop's faster event loop when it is installed
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
 
-from docia import Docia, DociaConfig, create_docia
-from docia.models.document import Document, QueryMode
-from docia.models.agent import ConversationMessage
-from .commands import add, list, remove, search, query, clear, stats, config
-from .commands.interactive_commands import shell, start
+# Add the parent directory to Python path for imports
+sys.path.insert(0, str(_PROJECT_ROOT))
+
+from docia.utils.json_helpers import json_loads, json_dumpb
+from . import commands
+
+# The engine and its models are imported where they are used, so that
+# `docia --help` doesn't load the orchestrator, processors and AI SDKs
+if TYPE_CHECKING:
+    from docia import Docia, DociaConfig
+    from docia.models.document import Document
+    from docia.models.agent import ConversationMessage
+
+# CLI command name -> attribute of cli.commands, imported on first use
+_LAZY_COMMANDS = {
+    'add': 'add',
+    'list': 'list_documents',
+    'remove': 'remove',
+    'search': 'search',
+    'query': 'query',
+    'clear': 'clear',
+    'stats': 'stats',
+    'config': 'config',
+    'shell': 'shell',
+    'start': 'start',
+}
+
+# Commands that run without a Docia engine
+_ENGINE_FREE_COMMANDS = frozenset({'config'})
 
 
 class DociaCLI:
     """Docia CLI Application"""
 
     def __init__(self):
-        self.docia: Optional[Docia] = None
-        self.config_file = Path.home() / ".docia" / "config.json"
-        self.conversation_history: List[ConversationMessage] = []
+        self.docia: Optional["Docia"] = None
+        self.config_file = CONFIG_FILE
+        self.conversation_history: List["ConversationMessage"] = []
+        # Parsed config files keyed by path, as (mtime_ns, data)
+        self._config_cache: Dict[Path, Tuple[int, Dict[str, Any]]] = {}
 
-    def initialize_docia(self, config_path: Optional[str] = None) -> Docia:
+    def initialize_docia(self, config_path: Optional[str] = None) -> "Docia":
         """Initialize Docia with configuration"""
+        from docia import Docia, DociaConfig
+
         try:
             if config_path and Path(config_path).exists():
                 # Load from config file
@@ -78,15 +113,35 @@ class DociaCLI:
             click.echo(f"ERROR: Failed to initialize Docia: {e}", err=True)
             sys.exit(1)
 
-    def _load_config_from_file(self, config_path: str) -> DociaConfig:
+    def load_config_data(self, config_path: Optional[Path] = None) -> Dict[str, Any]:
+        """Read a JSON config file, reusing the last parse while its mtime is unchanged"""
+        path = Path(config_path or self.config_file)
+        mtime_ns = path.stat().st_mtime_ns
+        cached = self._config_cache.get(path)
+        if cached is None or cached[0] != mtime_ns:
+            with open(path, 'rb') as f:
+                cached = (mtime_ns, json_loads(f.read()))
+            self._config_cache[path] = cached
+        return dict(cached[1])
+
+    def save_config_data(self, config_data: Dict[str, Any], config_path: Optional[Path] = None):
+        """Write a JSON config file atomically"""
+        path = Path(config_path or self.config_file)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(json_dumpb(config_data, indent=True))
+        os.replace(tmp_path, path)
+        self._config_cache.pop(path, None)
+
+    def _load_config_from_file(self, config_path: str) -> "DociaConfig":
         """Load configuration from JSON file"""
-        with open(config_path, 'r') as f:
-            config_data = json.load(f)
-        return DociaConfig.from_dict(config_data)
+        from docia import DociaConfig
 
-    def _save_config_to_file(self, config: DociaConfig):
+        return DociaConfig.from_dict(self.load_config_data(config_path))
+
+    def _save_config_to_file(self, config: "DociaConfig"):
         """Save configuration to file"""
-        self.config_file.parent.mkdir(parents=True, exist_ok=True)
         config_dict = {
             'provider': config.provider,
             'model': config.model,
@@ -101,57 +156,96 @@ class DociaCLI:
             'log_level': config.log_level
         }
 
-        with open(self.config_file, 'w') as f:
-            json.dump(config_dict, f, indent=2)
+        self.save_config_data(config_dict)
 
-    def _format_document_info(self, doc: Document) -> str:
+    def _format_document_info(self, doc: "Document") -> str:
         """Format document information for display"""
         pages_info = f"{len(doc.pages)} pages" if doc.pages else "0 pages"
         status_icon = "OK:" if doc.status.value == "completed" else "PROCESSING:"
         return f"{status_icon} {doc.name} ({doc.id}) - {pages_info}"
 
-    def _progress_callback(self, event_type: str, data):
+    async def _progress_callback(self, event_type: str, data):
         """Callback for tracking task progress"""
+        text = self._format_progress(event_type, data)
+        if text is not None:
+            click.echo(text)
+
+    def _format_progress(self, event_type: str, data) -> Optional[str]:
+        """Render a progress event as one block of text, or None if it isn't shown"""
         if event_type == 'plan_created':
-            click.echo(f"PLAN: Created analysis plan with {len(data.tasks)} tasks")
-            for i, task in enumerate(data.tasks, 1):
-                click.echo(f"   {i}. {task.name} ({task.information_type})")
+            lines = [f"PLAN: Created analysis plan with {len(data.tasks)} tasks"]
+            lines.extend(
+                f"   {i}. {task.name} ({task.information_type})"
+                for i, task in enumerate(data.tasks, 1)
+            )
+            return "\n".join(lines)
 
         elif event_type == 'task_started':
-            click.echo(f"SEARCH: Starting: {data['task'].name}")
+            return f"SEARCH: Starting: {data['task'].name}"
 
         elif event_type == 'pages_selected':
-            pages = data['page_numbers']
-            click.echo(f"PAGES: Selected pages: {pages}")
+            return f"PAGES: Selected pages: {data['page_numbers']}"
 
         elif event_type == 'task_completed':
-            result = data['result']
-            pages_analyzed = len(result.selected_pages)
-            click.echo(f"SUCCESS: Completed: {data['task'].name} ({pages_analyzed} pages)")
+            pages_analyzed = len(data['result'].selected_pages)
+            return f"SUCCESS: Completed: {data['task'].name} ({pages_analyzed} pages)"
 
         elif event_type == 'plan_updated':
-            click.echo(f"UPDATED: Plan: {len(data.tasks)} tasks remaining")
+            return f"UPDATED: Plan: {len(data.tasks)} tasks remaining"
+
+        return None
 
 
 # Create global CLI instance
 cli_instance = DociaCLI()
 
 
-@click.group(invoke_without_command=True)
+class LazyGroup(click.Group):
+    """Click group that imports a subcommand's module only when it is invoked"""
+
+    def list_commands(self, ctx):
+        return sorted(set(super().list_commands(ctx)) | set(_LAZY_COMMANDS))
+
+    def get_command(self, ctx, cmd_name):
+        command = super().get_command(ctx, cmd_name)
+        if command is None and cmd_name in _LAZY_COMMANDS:
+            command = getattr(commands, _LAZY_COMMANDS[cmd_name])
+        return command
+
+    def resolve_command(self, ctx, args):
+        cmd_name, command, cmd_args = super().resolve_command(ctx, args)
+        # Click clears ctx.args before the group callback runs, so keep the
+        # subcommand's arguments for it to spot a help request
+        ctx.meta['docia.subcommand_args'] = cmd_args
+        return cmd_name, command, cmd_args
+
+
+@click.group(cls=LazyGroup, invoke_without_command=True)
 @click.option('--config', '-c', help='Path to configuration file')
 @click.option('--provider', type=click.Choice(['openai', 'openrouter']), help='AI provider')
 @click.option('--api-key', help='API key for the selected provider')
 @click.option('--storage-path', help='Local storage path for documents')
+@click.option('--debug', is_flag=True, help='Show full tracebacks on errors')
 @click.pass_context
-def docia(ctx, config, provider, api_key, storage_path):
+def docia(ctx, config, provider, api_key, storage_path, debug):
     """Docia - VisionLM Document Intelligence CLI"""
     ctx.ensure_object(dict)
+    ctx.obj['debug'] = debug
+    ctx.obj['cli'] = cli_instance
+
+    # Completion, subcommand help and engine-free commands don't need Docia
+    if ctx.resilient_parsing or ctx.invoked_subcommand in _ENGINE_FREE_COMMANDS:
+        return
+    if any(arg in ctx.help_option_names for arg in ctx.meta.get('docia.subcommand_args', ())):
+        return
 
     # Initialize Docia
     try:
         if config:
             cli_instance.docia = cli_instance.initialize_docia(config)
         else:
+            from docia import Docia, DociaConfig
+
             # Create config with provided options
             config_dict = {}
             if provider:
@@ -162,15 +256,17 @@ def docia(ctx, config, provider, api_key, storage_path):
             # Load environment configuration first
             env_config = DociaConfig.from_env()
 
+            # Pass the CLI key in the same replace, which validates the provider's key
+            if api_key:
+                config_dict[f"{provider or env_config.provider}_api_key"] = api_key
+
             # Override with provided options
             if config_dict:
-                for key, value in config_dict.items():
-                    setattr(env_config, key, value)
+                env_config = dataclasses.replace(env_config, **config_dict)
 
             cli_instance.docia = Docia(config=env_config, api_key=api_key)
 
         ctx.obj['docia'] = cli_instance.docia
-        ctx.obj['cli'] = cli_instance
 
         # If no command is provided, start interactive shell
         if ctx.invoked_subcommand is None:
@@ -184,18 +280,5 @@ def docia(ctx, config, provider, api_key, storage_path):
         sys.exit(1)
 
 
-# Register all commands
-docia.add_command(add)
-docia.add_command(list)
-docia.add_command(remove)
-docia.add_command(search)
-docia.add_command(query)
-docia.add_command(clear)
-docia.add_command(stats)
-docia.add_command(config)
-docia.add_command(shell)
-docia.add_command(start)
-
-
 if __name__ == '__main__':
     docia()
\ No newline at end of file
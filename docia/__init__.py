@@ -7,22 +7,24 @@ No vector databases required - just pure document understanding.
 
 __version__ = "0.1.0"
 
-from .models.document import Document, Page, QueryResult, QueryMode
-from .models.agent import ConversationMessage
-from .core.config import DociaConfig
-from .integrations import BaseProvider, create_provider
-from .docia import Docia, create_docia, create_memory_docia
+from .utils.lazy import lazy_exports
 
-__all__ = [
-    "Docia",
-    "create_docia",
-    "create_memory_docia",
-    "Document",
-    "Page",
-    "QueryResult",
-    "QueryMode",
-    "ConversationMessage",
-    "DociaConfig",
-    "BaseProvider",
-    "create_provider"
-]
\ No newline at end of file
+# Loaded on first access so that `import docia` doesn't load the orchestrator,
+# processors and AI SDKs
+_LAZY_ATTRS = {
+    "Docia": ".docia",
+    "create_docia": ".docia",
+    "create_memory_docia": ".docia",
+    "Document": ".models.document",
+    "Page": ".models.document",
+    "QueryResult": ".models.document",
+    "QueryMode": ".models.document",
+    "ConversationMessage": ".models.agent",
+    "DociaConfig": ".core.config",
+    "BaseProvider": ".integrations",
+    "create_provider": ".integrations",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_ATTRS)
+
+__all__ = list(_LAZY_ATTRS)
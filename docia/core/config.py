@@ -5,8 +5,12 @@ VisionLM-powered document intelligence configuration.
 Optimized for maximum understanding and minimum complexity.
 """
 
+import copy
 import os
+import sys
 from dataclasses import dataclass, field
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Tuple, Optional, Dict, Any
 from pathlib import Path
 
@@ -35,6 +39,7 @@ class DociaConfig:
     provider: str = "openrouter"         # Vision AI provider: openai, openrouter
     model: str = "gpt-4o"                # Primary intelligence model
     vision_model: str = "gpt-4o"         # Vision intelligence model
+    fallback_providers: Tuple[str, ...] = ()  # Providers that take over when the primary is rate limited or down
 
     # Vision AI Security
     openai_api_key: Optional[str] = None
@@ -44,21 +49,28 @@ class DociaConfig:
     max_agent_iterations: int = 5    # Maximum adaptive reasoning cycles
     max_pages_per_task: int = 6      # Pages per intelligence cycle
     max_tasks_per_plan: int = 4      # Initial intelligence tasks
+    max_task_concurrency: int = 4    # Intelligence tasks analyzed at once
 
     # Conversation Intelligence Settings
     max_conversation_turns: int = 8  # Conversation memory depth
     turns_to_summarize: int = 5      # Conversation summary window
     turns_to_keep_full: int = 3      # Recent conversation retention
 
+    # Response Caching
+    response_cache_size: int = 128   # Identical low-temperature provider calls remembered (0 disables)
+    result_cache_size: int = 32      # Answered queries remembered per knowledge base state (0 disables)
+
     # Intelligence Logging
     log_level: str = "INFO"          # Intelligence engine logging
     log_requests: bool = False       # Request visibility for debugging
 
     def __post_init__(self):
         """Initialize and validate intelligence engine configuration"""
-        # Create knowledge storage directory
-        if self.storage_type == "local":
-            Path(self.local_storage_path).mkdir(parents=True, exist_ok=True)
+        # Share one copy of each enum-like setting across configurations
+        for name in _INTERNED_FIELDS:
+            value = getattr(self, name)
+            if type(value) is str:
+                setattr(self, name, sys.intern(value))
 
         # Load Vision AI keys from environment
         if not self.openai_api_key:
@@ -86,26 +98,26 @@ class DociaConfig:
         if self.jpeg_quality < 1 or self.jpeg_quality > 100:
             raise ValueError("Vision quality must be between 1 and 100")
 
+        if self.max_task_concurrency < 1:
+            raise ValueError("Task concurrency must be at least 1")
+
+    def ensure_storage(self) -> Path:
+        """Create the local knowledge storage directory if needed and return it"""
+        path = Path(self.local_storage_path)
+        path.mkdir(parents=True, exist_ok=True)
+        return path
+
     def _set_provider_defaults(self):
         """Set optimal Vision AI defaults by provider"""
-        provider_defaults = {
-            "openai": {
-                "model": "gpt-4o",
-                "vision_model": "gpt-4o"
-            },
-            "openrouter": {
-                "model": "openai/gpt-4o",
-                "vision_model": "google/gemini-2.5-flash"
-            }
-        }
+        defaults = _PROVIDER_DEFAULTS.get(self.provider)
+        if defaults is None:
+            return
 
-        if self.provider in provider_defaults:
-            defaults = provider_defaults[self.provider]
-            # Apply provider-specific model defaults
-            if self.model == "gpt-4o":
-                self.model = defaults["model"]
-            if self.vision_model == "gpt-4o":
-                self.vision_model = defaults["vision_model"]
+        # Apply provider-specific model defaults
+        if self.model == "gpt-4o":
+            self.model = defaults["model"]
+        if self.vision_model == "gpt-4o":
+            self.vision_model = defaults["vision_model"]
 
     @classmethod
     def from_dict(cls, config_dict: Dict[str, Any]) -> 'DociaConfig':
@@ -114,38 +126,14 @@ class DociaConfig:
 
     @classmethod
     def from_env(cls) -> 'DociaConfig':
-        """Create intelligence configuration from environment"""
-        config_dict = {}
-
-        # Map environment variables to intelligence settings
-        env_mapping = {
-            'DOCIA_PROVIDER': 'provider',
-            'DOCIA_MODEL': 'model',
-            'DOCIA_VISION_MODEL': 'vision_model',
-            'DOCIA_STORAGE_PATH': 'local_storage_path',
-            'DOCIA_STORAGE_TYPE': 'storage_type',
-            'DOCIA_JPEG_QUALITY': 'jpeg_quality',
-            'DOCIA_VISION_DETAIL': 'vision_detail',
-            'DOCIA_MAX_AGENT_ITERATIONS': 'max_agent_iterations',
-            'DOCIA_MAX_PAGES_PER_TASK': 'max_pages_per_task',
-            'DOCIA_MAX_TASKS_PER_PLAN': 'max_tasks_per_plan',
-            'DOCIA_MAX_CONVERSATION_TURNS': 'max_conversation_turns',
-            'DOCIA_LOG_LEVEL': 'log_level',
-            'DOCIA_LOG_REQUESTS': 'log_requests',
-        }
+        """Create intelligence configuration from environment
 
-        for env_var, config_field in env_mapping.items():
-            value = os.getenv(env_var)
-            if value is not None:
-                # Convert environment values to appropriate types
-                if config_field in ['jpeg_quality', 'max_agent_iterations', 'max_pages_per_task', 'max_tasks_per_plan', 'max_conversation_turns']:
-                    config_dict[config_field] = int(value)
-                elif config_field in ['log_requests']:
-                    config_dict[config_field] = value.lower() in ('true', '1', 'yes')
-                else:
-                    config_dict[config_field] = value
-
-        return cls(**config_dict)
+        Parsed configurations are cached per set of environment values;
+        each call returns its own copy so callers may modify it.
+        """
+        env_values = tuple(os.environ.get(env_var) for env_var, _, _ in _ENV_SPEC)
+        api_keys = (os.environ.get("OPENAI_API_KEY"), os.environ.get("OPENROUTER_API_KEY"))
+        return copy.copy(_cached_from_env(cls, env_values, api_keys))
 
     def get_query_config(self) -> Dict[str, Any]:
         """Get intelligence query configuration"""
@@ -164,3 +152,61 @@ class DociaConfig:
                 raise ValueError("OpenRouter API key required for Vision AI")
         else:
             raise ValueError(f"Unsupported Vision AI provider: {self.provider}")
+
+
+# Optimal Vision AI model defaults by provider
+_PROVIDER_DEFAULTS = MappingProxyType({
+    "openai": {
+        "model": "gpt-4o",
+        "vision_model": "gpt-4o"
+    },
+    "openrouter": {
+        "model": "openai/gpt-4o",
+        "vision_model": "google/gemini-2.5-flash"
+    }
+})
+
+# Settings drawn from a small closed set of values; interned on construction
+_INTERNED_FIELDS = ('provider', 'storage_type', 'log_level', 'vision_detail', 'model', 'vision_model')
+
+def _parse_bool(value: str) -> bool:
+    """Interpret an environment flag"""
+    return value.lower() in ('true', '1', 'yes')
+
+
+def _parse_list(value: str) -> Tuple[str, ...]:
+    """Interpret a comma-separated environment list"""
+    return tuple(item.strip() for item in value.split(',') if item.strip())
+
+
+# Environment variables mapped to intelligence settings and their value converters
+_ENV_SPEC = (
+    ('DOCIA_PROVIDER', 'provider', str),
+    ('DOCIA_MODEL', 'model', str),
+    ('DOCIA_VISION_MODEL', 'vision_model', str),
+    ('DOCIA_FALLBACK_PROVIDERS', 'fallback_providers', _parse_list),
+    ('DOCIA_STORAGE_PATH', 'local_storage_path', str),
+    ('DOCIA_STORAGE_TYPE', 'storage_type', str),
+    ('DOCIA_JPEG_QUALITY', 'jpeg_quality', int),
+    ('DOCIA_VISION_DETAIL', 'vision_detail', str),
+    ('DOCIA_MAX_AGENT_ITERATIONS', 'max_agent_iterations', int),
+    ('DOCIA_MAX_PAGES_PER_TASK', 'max_pages_per_task', int),
+    ('DOCIA_MAX_TASKS_PER_PLAN', 'max_tasks_per_plan', int),
+    ('DOCIA_MAX_TASK_CONCURRENCY', 'max_task_concurrency', int),
+    ('DOCIA_MAX_CONVERSATION_TURNS', 'max_conversation_turns', int),
+    ('DOCIA_RESPONSE_CACHE_SIZE', 'response_cache_size', int),
+    ('DOCIA_RESULT_CACHE_SIZE', 'result_cache_size', int),
+    ('DOCIA_LOG_LEVEL', 'log_level', str),
+    ('DOCIA_LOG_REQUESTS', 'log_requests', _parse_bool),
+)
+
+
+@lru_cache(maxsize=8)
+def _cached_from_env(cls, env_values: Tuple[Optional[str], ...], api_keys: Tuple[Optional[str], Optional[str]]) -> DociaConfig:
+    """Build a configuration from environment values (api_keys only key the cache)"""
+    config_dict = {
+        config_field: convert(value)
+        for (_, config_field, convert), value in zip(_ENV_SPEC, env_values)
+        if value is not None
+    }
+    return cls(**config_dict)
@@ -3,6 +3,9 @@ Core utility functions for Docia
 """
 import re
 
+# Matches ```json...``` or ```...``` wrappers around a whole response
+_CODE_BLOCK_RE = re.compile(r'^```(?:json)?\s*\n?(.*?)\n?```$', re.DOTALL | re.IGNORECASE)
+
 
 def sanitize_llm_json(response: str) -> str:
     """
@@ -24,12 +27,10 @@ def sanitize_llm_json(response: str) -> str:
     # Strip leading/trailing whitespace
     cleaned = response.strip()
     
-    # Remove markdown code block wrappers
-    # Matches ```json...``` or ```...``` patterns
-    code_block_pattern = r'^```(?:json)?\s*\n?(.*?)\n?```$'
-    match = re.match(code_block_pattern, cleaned, re.DOTALL | re.IGNORECASE)
-    
-    if match:
-        cleaned = match.group(1).strip()
-    
+    # Remove markdown code block wrappers; most responses have none
+    if cleaned.startswith('```'):
+        match = _CODE_BLOCK_RE.match(cleaned)
+        if match:
+            cleaned = match.group(1).strip()
+
     return cleaned
\ No newline at end of file
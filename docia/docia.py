@@ -6,7 +6,8 @@ No vector databases required.
 """
 
 import asyncio
-from typing import Optional, List, Dict, Any, Union, Callable
+import dataclasses
+from typing import Optional, List, Dict, Any, Union, Callable, AsyncIterator
 from pathlib import Path
 import logging
 
@@ -21,7 +22,7 @@ from .storage.local import LocalStorage
 from .storage.memory import InMemoryStorage
 from .storage.base import BaseStorage
 from .intelligence.summarizer import PageSummarizer
-from .intelligence.orchestrator import Orchestrator
+from .intelligence.orchestrator import Orchestrator, TASK_FAILURE_PREFIX
 from .integrations import create_provider
 from .utils.async_helpers import sync_wrapper, make_sync_version
 
@@ -53,10 +54,10 @@ class Docia:
         if config is None:
             config = DociaConfig()
         
-        # Override API key if provided
+        # Override API key if provided, without mutating the caller's config
         if api_key:
             if config.provider == "openai":
-                config.openai_api_key = api_key
+                config = dataclasses.replace(config, openai_api_key=api_key)
         
         self.config = config
         
@@ -78,13 +79,13 @@ class Docia:
             if self.provider is None:
                 raise ValueError("Failed to create Vision AI provider - check configuration")
         except Exception as e:
-            logger.error(f"Failed to initialize Vision AI provider: {e}")
+            logger.error("Failed to initialize Vision AI provider: %s", e)
             raise ValueError(f"Vision AI provider initialization failed: {e}")
 
         self.summarizer = PageSummarizer(config)
         self.orchestrator = Orchestrator(self.provider, self.storage, config)
         
-        logger.info(f"Docia Intelligence Engine initialized with {config.provider} Vision AI and {type(self.storage).__name__} knowledge storage")
+        logger.info("Docia Intelligence Engine initialized with %s Vision AI and %s knowledge storage", config.provider, type(self.storage).__name__)
     
     # Document Intelligence Operations
 
@@ -106,7 +107,7 @@ class Docia:
             Enhanced Document with intelligence metadata
         """
         file_path = str(file_path)
-        logger.info(f"Adding document: {file_path}")
+        logger.info("Adding document: %s", file_path)
         
         # Process document with Vision AI
         processor = self.processor_factory.get_processor(file_path)
@@ -117,14 +118,14 @@ class Docia:
             document.name = document_name
 
         # Generate intelligence summary
-        logger.info(f"Generating intelligence summary for {document.name}")
+        logger.info("Generating intelligence summary for %s", document.name)
         document = await self.summarizer.summarize_document(document)
 
         # Store in knowledge base
         document.status = DocumentStatus.COMPLETED
         await self.storage.save_document(document)
 
-        logger.info(f"Document {document.id} intelligence-ready: {document.name}")
+        logger.info("Document %s intelligence-ready: %s", document.id, document.name)
         return document
     
     async def get_document(self, document_id: str) -> Optional[Document]:
@@ -143,6 +144,11 @@ class Docia:
         """Search documents by name and summary"""
         return await self.storage.search_documents(query, limit)
     
+    async def search_documents_stream(self, query: str, limit: int = 10) -> AsyncIterator[Dict[str, Any]]:
+        """Search documents by name and summary, yielding each match as it is found"""
+        async for doc_info in self.storage.search_documents_stream(query, limit):
+            yield doc_info
+    
     # Intelligence Query Operations (Vision-based RAG)
 
     async def query(
@@ -169,7 +175,7 @@ class Docia:
         Returns:
             Intelligent QueryResult with answer and insights
         """
-        logger.info(f"Vision AI processing query: {question}")
+        logger.info("Vision AI processing query: %s", question)
 
         try:
             # Execute adaptive Vision AI analysis
@@ -194,7 +200,7 @@ class Docia:
             )
             
         except Exception as e:
-            logger.error(f"Vision AI query failed: {e}")
+            logger.error("Vision AI query failed: %s", e)
             return QueryResult(
                 query=question,
                 answer=f"Docia Intelligence encountered an issue: {str(e)}",
@@ -209,8 +215,10 @@ class Docia:
     def _calculate_confidence(self, agent_result) -> float:
         """Calculate intelligence confidence score"""
         # Base confidence on task success rate
-        task_success_rate = len([r for r in agent_result.task_results
-                               if r.analysis and not r.analysis.startswith("Task execution failed")]) / len(agent_result.task_results)
+        task_success_rate = sum(
+            1 for r in agent_result.task_results
+            if r.analysis and not r.analysis.startswith(TASK_FAILURE_PREFIX)
+        ) / len(agent_result.task_results)
 
         # Boost confidence for page analysis depth
         page_boost = min(0.2, agent_result.get_total_pages_analyzed() * 0.02)
@@ -330,8 +338,11 @@ class Docia:
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit"""
-        # Cleanup if needed
-        pass
+        await self.aclose()
+
+    async def aclose(self):
+        """Close the provider's pooled HTTP connections"""
+        await self.provider.aclose()
     
     def __enter__(self):
         """Sync context manager entry"""
@@ -8,11 +8,13 @@ Supports OpenAI and OpenRouter Vision AI services.
 from .base import BaseProvider
 from .openai import OpenAIProvider
 from .openrouter import OpenRouterProvider
+from .multi import MultiProvider
 from .factory import create_provider
 
 __all__ = [
     "BaseProvider",
     "OpenAIProvider",
     "OpenRouterProvider",
+    "MultiProvider",
     "create_provider"
 ]
\ No newline at end of file
@@ -4,17 +4,95 @@ Docia Provider Interface for Vision Language Model Operations
 Base interface for AI providers with Vision Language Model capabilities.
 """
 
+import asyncio
 import base64
+import hashlib
+import io
+import os
+import stat
+import weakref
 from abc import ABC, abstractmethod
-from typing import List, Optional
-from pathlib import Path
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, AsyncIterator
+from collections import OrderedDict
 from dataclasses import dataclass
 import logging
 
 from ..core.config import DociaConfig
+from ..utils.json_helpers import json_dumpb
 
 logger = logging.getLogger(__name__)
 
+# Use pybase64's vectorized encoder when it is installed
+try:
+    from pybase64 import b64encode_as_string as _b64encode
+except ImportError:
+    def _b64encode(data: bytes) -> str:
+        return base64.b64encode(data).decode('ascii')
+
+# Number of encoded page images kept in memory (roughly 0.5 MB each)
+IMAGE_CACHE_SIZE = 64
+
+
+# Longest image side worth sending at each vision detail level; larger images
+# are downscaled by the API anyway, so the extra pixels only cost upload time
+MAX_IMAGE_SIDE = {
+    "low": 512,
+    "high": 2048,
+    "auto": 2048,
+}
+
+# JPEG quality used when an oversized image is re-encoded
+DOWNSCALE_JPEG_QUALITY = 85
+
+
+@lru_cache(maxsize=IMAGE_CACHE_SIZE)
+def _cached_data_url(image_path: str, mtime_ns: int, size: int, max_side: int) -> str:
+    """Build an image data URL; mtime and size key the cache so edited files are re-read"""
+    with open(image_path, 'rb') as image_file:
+        data = image_file.read()
+    data = _downscale_image(data, max_side)
+    return f"data:{_image_mime_type(data)};base64,{_b64encode(data)}"
+
+
+def _downscale_image(data: bytes, max_side: int) -> bytes:
+    """Re-encode an image as JPEG if its longest side exceeds max_side, else return it unchanged"""
+    from PIL import Image
+
+    with Image.open(io.BytesIO(data)) as img:
+        # Only the header has been read so far
+        if max(img.size) <= max_side:
+            return data
+        if img.mode != 'RGB':
+            img = img.convert('RGB')
+        img.thumbnail((max_side, max_side), Image.Resampling.LANCZOS)
+        output = io.BytesIO()
+        img.save(output, format='JPEG', quality=DOWNSCALE_JPEG_QUALITY, optimize=True)
+    return output.getvalue()
+
+
+# Leading bytes of the image formats accepted by Vision Language Model APIs
+_IMAGE_SIGNATURES = (
+    (b'\x89PNG\r\n\x1a\n', 'image/png'),
+    (b'GIF87a', 'image/gif'),
+    (b'GIF89a', 'image/gif'),
+)
+
+
+def _max_image_side(detail: str) -> int:
+    """Longest image side sent for a vision detail level"""
+    return MAX_IMAGE_SIDE.get(detail, MAX_IMAGE_SIDE["high"])
+
+
+def _image_mime_type(data: bytes) -> str:
+    """Detect an image's MIME type from its header, defaulting to JPEG"""
+    for signature, mime_type in _IMAGE_SIGNATURES:
+        if data.startswith(signature):
+            return mime_type
+    if data[:4] == b'RIFF' and data[8:12] == b'WEBP':
+        return 'image/webp'
+    return 'image/jpeg'
+
 
 @dataclass
 class APIResult:
@@ -23,6 +101,115 @@ class APIResult:
     cost: Optional[float] = None
 
 
+# Content part marker ending a prompt prefix worth caching on the provider side
+# (Anthropic's cache_control breakpoint); APIs without explicit caching drop it
+CACHE_CONTROL = {"type": "ephemeral"}
+
+# OpenAI-compatible JSON mode: the model may only emit a syntactically valid JSON object
+JSON_RESPONSE_FORMAT = {"type": "json_object"}
+
+
+def _strip_cache_control(messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Copy messages without cache_control markers, or return them as-is if they have none"""
+    def has_marker(message):
+        content = message.get("content")
+        return isinstance(content, list) and any("cache_control" in part for part in content)
+
+    if not any(has_marker(message) for message in messages):
+        return messages
+    return [
+        {
+            **message,
+            "content": [
+                {key: value for key, value in part.items() if key != "cache_control"}
+                for part in message["content"]
+            ]
+        } if has_marker(message) else message
+        for message in messages
+    ]
+
+
+# Calls above this temperature are sampled too freely for their responses to be reused
+MAX_CACHEABLE_TEMPERATURE = 0.3
+
+
+class ResponseCache:
+    """LRU cache of responses keyed by a hash of the request payload"""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+
+    def make_key(self, *payload: Any) -> Optional[str]:
+        """Hash a request payload, or return None when it shouldn't be cached"""
+        if self.maxsize <= 0:
+            return None
+        return hashlib.sha256(json_dumpb(payload)).hexdigest()
+
+    def get(self, key: Optional[str]) -> Optional[Any]:
+        """Look up a response, marking it most recently used"""
+        if key is None:
+            return None
+        response = self._entries.get(key)
+        if response is not None:
+            self._entries.move_to_end(key)
+        return response
+
+    def put(self, key: Optional[str], response: Any):
+        """Store a response, evicting the least recently used beyond maxsize"""
+        if key is None:
+            return
+        self._entries[key] = response
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drop all cached responses"""
+        self._entries.clear()
+
+
+def create_http_client():
+    """Create the pooled HTTP client shared by an OpenAI-compatible provider's requests
+
+    Uses HTTP/2 when the h2 package is installed so concurrent calls multiplex
+    over one connection; otherwise keep-alive HTTP/1.1 connections are pooled.
+    JSON request bodies, which carry the base64 page images, are encoded with
+    orjson when it is installed.
+    """
+    import httpx
+
+    try:
+        import h2  # noqa: F401
+        http2 = True
+    except ImportError:
+        http2 = False
+
+    try:
+        import orjson
+    except ImportError:
+        client_class = httpx.AsyncClient
+    else:
+        class OrjsonAsyncClient(httpx.AsyncClient):
+            """httpx client that encodes JSON request bodies with orjson"""
+
+            def build_request(self, method, url, *, content=None, json=None, headers=None, **kwargs):
+                if json is not None and content is None:
+                    content = orjson.dumps(json)
+                    headers = httpx.Headers(headers)
+                    headers.setdefault("Content-Type", "application/json")
+                    json = None
+                return super().build_request(method, url, content=content, json=json, headers=headers, **kwargs)
+
+        client_class = OrjsonAsyncClient
+
+    return client_class(
+        http2=http2,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+        timeout=httpx.Timeout(120.0, connect=5.0)
+    )
+
+
 class BaseProvider(ABC):
     """Base class for Vision Language Model providers"""
 
@@ -30,15 +217,39 @@ class BaseProvider(ABC):
         self.config = config
         self.last_api_cost: Optional[float] = None
         self.total_cost: float = 0.0
+        self.response_cache = ResponseCache(config.response_cache_size)
+        # API clients by event loop; pooled connections can't cross loops
+        self._clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any]" = weakref.WeakKeyDictionary()
+
+    @property
+    def client(self) -> Any:
+        """API client for the running event loop, created on first use in that loop
+
+        Keep-alive connections are reused by every call made from one loop;
+        loops created by asyncio.run or the sync wrappers get their own pool.
+        """
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None:
+            client = self._clients[loop] = self._create_client()
+        return client
+
+    def _create_client(self) -> Any:
+        """Create the API client used by calls from one event loop"""
+        raise NotImplementedError(f"{type(self).__name__} does not use an API client")
 
     @abstractmethod
     async def process_text_messages(
         self,
         messages: List[dict],
         max_tokens: int = 512,
-        temperature: float = 0.3
+        temperature: float = 0.3,
+        json_mode: bool = False
     ) -> str:
-        """Process text-only messages through the provider API"""
+        """Process text-only messages through the provider API
+
+        With json_mode, providers that support it constrain the output to a JSON object.
+        """
         pass
 
     @abstractmethod
@@ -46,11 +257,86 @@ class BaseProvider(ABC):
         self,
         messages: List[dict],
         max_tokens: int = 300,
-        temperature: float = 0.3
+        temperature: float = 0.3,
+        json_mode: bool = False
     ) -> str:
-        """Process messages with text and images through the Vision Language Model API"""
+        """Process messages with text and images through the Vision Language Model API
+
+        With json_mode, providers that support it constrain the output to a JSON object.
+        """
         pass
 
+    async def process_text_messages_stream(
+        self,
+        messages: List[dict],
+        max_tokens: int = 512,
+        temperature: float = 0.3
+    ) -> AsyncIterator[str]:
+        """Stream text-only output as it is generated
+
+        Default implementation yields the complete response as a single chunk;
+        providers with streaming APIs override this.
+        """
+        yield await self.process_text_messages(
+            messages=messages,
+            max_tokens=max_tokens,
+            temperature=temperature
+        )
+
+    async def process_multimodal_messages_stream(
+        self,
+        messages: List[dict],
+        max_tokens: int = 300,
+        temperature: float = 0.3
+    ) -> AsyncIterator[str]:
+        """Stream output for messages with text and images as it is generated
+
+        Default implementation yields the complete response as a single chunk;
+        providers with streaming APIs override this.
+        """
+        yield await self.process_multimodal_messages(
+            messages=messages,
+            max_tokens=max_tokens,
+            temperature=temperature
+        )
+
+    async def aclose(self):
+        """Close the pooled connections of every client whose event loop can still run
+
+        The running loop's client is closed here and clients of loops running in
+        other threads are closed on their own loop. Clients of loops that are
+        closed or idle can't be closed from this loop and are left to garbage
+        collection.
+        """
+        running_loop = asyncio.get_running_loop()
+        clients = list(self._clients.items())
+        self._clients.clear()
+        closes = []
+        for loop, client in clients:
+            if loop is running_loop:
+                closes.append(client.close())
+            elif loop.is_running():
+                closes.append(asyncio.wrap_future(asyncio.run_coroutine_threadsafe(client.close(), loop)))
+        await asyncio.gather(*closes)
+
+    def _response_format_kwargs(self, json_mode: bool) -> Dict[str, Any]:
+        """Request arguments asking an OpenAI-compatible API for JSON output"""
+        return {"response_format": JSON_RESPONSE_FORMAT} if json_mode else {}
+
+    def _response_cache_key(self, *payload: Any, temperature: float) -> Optional[str]:
+        """Cache key for a near-deterministic call, or None if it shouldn't be cached"""
+        if temperature > MAX_CACHEABLE_TEMPERATURE:
+            return None
+        return self.response_cache.make_key(*payload, temperature)
+
+    def _get_cached_response(self, cache_key: Optional[str]) -> Optional[str]:
+        """Return a remembered response; a hit costs nothing"""
+        response = self.response_cache.get(cache_key)
+        if response is not None:
+            logger.debug("Serving provider response from cache")
+            self.last_api_cost = 0.0
+        return response
+
     def get_last_cost(self) -> Optional[float]:
         """Get cost of the last Vision Language Model API call"""
         return self.last_api_cost
@@ -70,21 +356,129 @@ class BaseProvider(ABC):
         """Encode image to base64 for Vision Language Model API calls"""
         try:
             with open(image_path, 'rb') as image_file:
-                encoded_string = base64.b64encode(image_file.read()).decode('utf-8')
-                return encoded_string
+                return _b64encode(image_file.read())
         except Exception as e:
             logger.error(f"Failed to encode image {image_path}: {e}")
             raise
 
-    def _create_image_data_url(self, image_path: str) -> str:
-        """Create data URL for Vision Language Model image input"""
-        encoded_image = self._encode_image(image_path)
-        return f"data:image/jpeg;base64,{encoded_image}"
+    def _create_image_data_url(self, image_path: str, detail: str = "high") -> str:
+        """Create data URL for Vision Language Model image input
+
+        Page images recur across tasks and conversation turns, so data URLs
+        are cached per file version and detail level.
+        """
+        try:
+            file_stat = os.stat(image_path)
+            return _cached_data_url(
+                image_path, file_stat.st_mtime_ns, file_stat.st_size, _max_image_side(detail)
+            )
+        except Exception as e:
+            logger.error(f"Failed to encode image {image_path}: {e}")
+            raise
+
+    def _load_image_data_url(self, image_path: str, detail: str = "high") -> Optional[str]:
+        """Validate an image path and build its data URL, or None if it isn't a readable file"""
+        try:
+            file_stat = os.stat(image_path)
+        except OSError:
+            return None
+        if not stat.S_ISREG(file_stat.st_mode):
+            return None
+        return _cached_data_url(
+            image_path, file_stat.st_mtime_ns, file_stat.st_size, _max_image_side(detail)
+        )
+
+    def _apply_cache_hints(self, messages: List[Dict[str, Any]], model: str) -> List[Dict[str, Any]]:
+        """Adapt cache_control markers for a model's API; by default they are removed
+
+        Providers that can pass explicit cache breakpoints through override this.
+        """
+        return _strip_cache_control(messages)
+
+    async def _prepare_openai_messages(self, messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Prepare messages for OpenAI-compatible Vision Language Models by converting image paths to data URLs
+
+        Each distinct image and detail level is read and encoded once,
+        concurrently in the default executor.
+        """
+        image_keys = list(dict.fromkeys(
+            (content_item["image_path"], content_item.get("detail", "high"))
+            for message in messages
+            if message["role"] == "user" and isinstance(message["content"], list)
+            for content_item in message["content"]
+            if content_item["type"] == "image_path"
+        ))
+        loop = asyncio.get_running_loop()
+        data_urls = dict(zip(image_keys, await asyncio.gather(*(
+            loop.run_in_executor(None, self._load_image_data_url, image_path, detail)
+            for image_path, detail in image_keys
+        ))))
+
+        processed_messages = []
+
+        for message in messages:
+            if message["role"] == "system":
+                # System messages remain text-only
+                processed_messages.append(message)
+            elif message["role"] == "user" and isinstance(message["content"], list):
+                # User message with multimodal content for Vision Language Model
+                processed_content = []
+
+                for content_item in message["content"]:
+                    if content_item["type"] == "text":
+                        processed_content.append(content_item)
+                    elif content_item["type"] == "image_path":
+                        # Convert image path to Vision Language Model format
+                        detail = content_item.get("detail", "high")
+                        image_data_url = data_urls[content_item["image_path"], detail]
+                        if image_data_url is not None:
+                            image_content = {
+                                "type": "image_url",
+                                "image_url": {
+                                    "url": image_data_url,
+                                    "detail": detail
+                                }
+                            }
+                            if "cache_control" in content_item:
+                                image_content["cache_control"] = content_item["cache_control"]
+                            processed_content.append(image_content)
+                        else:
+                            logger.warning(f"Skipping invalid image path for Vision Language Model: {content_item['image_path']}")
+                    else:
+                        # Pass through other content types to Vision Language Model
+                        processed_content.append(content_item)
+
+                processed_messages.append({
+                    "role": message["role"],
+                    "content": processed_content
+                })
+            else:
+                # Regular text message
+                processed_messages.append(message)
+
+        return processed_messages
+
+    @staticmethod
+    def clear_image_cache():
+        """Drop all cached image data URLs"""
+        _cached_data_url.cache_clear()
 
     def _validate_image_path(self, image_path: str) -> bool:
         """Validate image path for Vision Language Model processing"""
-        path = Path(image_path)
-        return path.exists() and path.is_file()
+        try:
+            return stat.S_ISREG(os.stat(image_path).st_mode)
+        except (OSError, ValueError):
+            return False
+
+
+def error_status_code(error: BaseException) -> Optional[int]:
+    """Find the HTTP status code on an error or on the API error it wraps"""
+    while error is not None:
+        status_code = getattr(error, 'status_code', None)
+        if status_code is not None:
+            return status_code
+        error = error.__cause__ or error.__context__
+    return None
 
 
 class ProviderError(Exception):
@@ -4,13 +4,20 @@ Docia Provider Factory for Vision Language Model Integration
 Factory pattern for creating Vision Language Model provider instances.
 """
 
+import dataclasses
 from typing import Union
 
 from .base import BaseProvider
 from .openai import OpenAIProvider
 from .openrouter import OpenRouterProvider
+from .multi import MultiProvider
 from ..core.config import DociaConfig
 
+_PROVIDER_CLASSES = {
+    "openai": OpenAIProvider,
+    "openrouter": OpenRouterProvider,
+}
+
 
 def create_provider(config: DociaConfig) -> BaseProvider:
     """
@@ -25,12 +32,26 @@ def create_provider(config: DociaConfig) -> BaseProvider:
     Raises:
         ValueError: If provider is not supported
     """
-    if config.provider == "openai":
-        return OpenAIProvider(config)
-    elif config.provider == "openrouter":
-        return OpenRouterProvider(config)
-    else:
+    primary = _create_single_provider(config)
+    if not config.fallback_providers:
+        return primary
+
+    # Fallbacks use their provider's default models
+    providers = [primary]
+    for name in config.fallback_providers:
+        fallback_config = dataclasses.replace(
+            config, provider=name, model="gpt-4o", vision_model="gpt-4o", fallback_providers=()
+        )
+        providers.append(_create_single_provider(fallback_config))
+    return MultiProvider(config, providers)
+
+
+def _create_single_provider(config: DociaConfig) -> BaseProvider:
+    """Create the provider named by config.provider"""
+    provider_class = _PROVIDER_CLASSES.get(config.provider)
+    if provider_class is None:
         raise ValueError(f"Unsupported provider: {config.provider}")
+    return provider_class(config)
 
 
 def get_available_providers() -> list[str]:
@@ -0,0 +1,156 @@
+"""
+Docia Multi-Provider for Vision Language Model Failover
+
+Spreads Vision Language Model calls over several providers and fails over
+when one is rate limited or unavailable.
+"""
+
+import time
+import logging
+from typing import List, Dict, Any, AsyncIterator
+
+from .base import BaseProvider, ProviderError, error_status_code
+from ..core.config import DociaConfig
+
+logger = logging.getLogger(__name__)
+
+# HTTP statuses after which a request is retried on the next provider
+FAILOVER_STATUS_CODES = frozenset({429, 500, 502, 503})
+
+# Seconds a provider is passed over after a failover-worthy error
+PROVIDER_COOLDOWN = 30.0
+
+
+class MultiProvider(BaseProvider):
+    """Vision Language Model provider pool
+
+    Sends each call to the provider with the fewest requests in flight,
+    skipping providers cooling down after rate limits or server errors.
+    """
+
+    def __init__(self, config: DociaConfig, providers: List[BaseProvider]):
+        super().__init__(config)
+        if not providers:
+            raise ValueError("MultiProvider requires at least one provider")
+
+        self.providers = providers
+        self._inflight = [0] * len(providers)
+        self._cooldown_until = [0.0] * len(providers)
+
+    def _provider_order(self) -> List[int]:
+        """Provider indices to try: available ones by load, then cooling ones"""
+        now = time.monotonic()
+        return sorted(
+            range(len(self.providers)),
+            key=lambda i: (self._cooldown_until[i] > now, self._inflight[i])
+        )
+
+    def _should_fail_over(self, index: int, error: ProviderError) -> bool:
+        """Put a provider on cooldown if its error warrants trying another one"""
+        if error_status_code(error) not in FAILOVER_STATUS_CODES:
+            return False
+        self._cooldown_until[index] = time.monotonic() + PROVIDER_COOLDOWN
+        logger.warning(f"Provider {type(self.providers[index]).__name__} unavailable, failing over: {error}")
+        return True
+
+    async def _call(self, method_name: str, **kwargs) -> str:
+        """Run a provider method, failing over across the pool"""
+        last_error = None
+        for index in self._provider_order():
+            provider = self.providers[index]
+            self._inflight[index] += 1
+            try:
+                result = await getattr(provider, method_name)(**kwargs)
+            except ProviderError as e:
+                if not self._should_fail_over(index, e):
+                    raise
+                last_error = e
+                continue
+            finally:
+                self._inflight[index] -= 1
+
+            self.last_api_cost = provider.last_api_cost
+            self.total_cost += provider.last_api_cost or 0.0
+            return result
+
+        raise last_error
+
+    async def process_text_messages(
+        self,
+        messages: List[Dict[str, Any]],
+        max_tokens: int = 512,
+        temperature: float = 0.3,
+        json_mode: bool = False
+    ) -> str:
+        """Process text-only messages through the least loaded available provider"""
+        return await self._call(
+            'process_text_messages', messages=messages, max_tokens=max_tokens, temperature=temperature,
+            json_mode=json_mode
+        )
+
+    async def process_multimodal_messages(
+        self,
+        messages: List[Dict[str, Any]],
+        max_tokens: int = 300,
+        temperature: float = 0.3,
+        json_mode: bool = False
+    ) -> str:
+        """Process multimodal messages through the least loaded available provider"""
+        return await self._call(
+            'process_multimodal_messages', messages=messages, max_tokens=max_tokens, temperature=temperature,
+            json_mode=json_mode
+        )
+
+    async def process_text_messages_stream(
+        self,
+        messages: List[Dict[str, Any]],
+        max_tokens: int = 512,
+        temperature: float = 0.3
+    ) -> AsyncIterator[str]:
+        """Stream text-only output from the least loaded available provider"""
+        async for chunk in self._stream(
+            'process_text_messages_stream', messages=messages, max_tokens=max_tokens, temperature=temperature
+        ):
+            yield chunk
+
+    async def process_multimodal_messages_stream(
+        self,
+        messages: List[Dict[str, Any]],
+        max_tokens: int = 300,
+        temperature: float = 0.3
+    ) -> AsyncIterator[str]:
+        """Stream multimodal output from the least loaded available provider"""
+        async for chunk in self._stream(
+            'process_multimodal_messages_stream', messages=messages, max_tokens=max_tokens, temperature=temperature
+        ):
+            yield chunk
+
+    async def _stream(self, method_name: str, **kwargs) -> AsyncIterator[str]:
+        """Stream from a provider method, failing over only before the first chunk arrives"""
+        last_error = None
+        for index in self._provider_order():
+            provider = self.providers[index]
+            started = False
+            self._inflight[index] += 1
+            try:
+                async for chunk in getattr(provider, method_name)(**kwargs):
+                    started = True
+                    yield chunk
+            except ProviderError as e:
+                if started or not self._should_fail_over(index, e):
+                    raise
+                last_error = e
+                continue
+            finally:
+                self._inflight[index] -= 1
+
+            self.last_api_cost = provider.last_api_cost
+            self.total_cost += provider.last_api_cost or 0.0
+            return
+
+        raise last_error
+
+    async def aclose(self):
+        """Close every provider in the pool"""
+        for provider in self.providers:
+            await provider.aclose()
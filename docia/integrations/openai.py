@@ -5,14 +5,13 @@ OpenAI GPT-4V provider implementation for Vision Language Model operations.
 """
 
 import logging
-from typing import List, Dict, Any
+from typing import List, Dict, Any, AsyncIterator
 
-from .base import BaseProvider, ProviderError
+from .base import BaseProvider, ProviderError, create_http_client
 from ..core.config import DociaConfig
 
 logger = logging.getLogger(__name__)
 
-
 class OpenAIProvider(BaseProvider):
     """OpenAI GPT-4 Vision Language Model provider
 
@@ -28,25 +27,36 @@ class OpenAIProvider(BaseProvider):
         # Import OpenAI client for Vision Language Model operations
         try:
             from openai import AsyncOpenAI
-            self.client = AsyncOpenAI(api_key=config.openai_api_key)
         except ImportError:
             raise ImportError("OpenAI library required for Vision Language Model operations. Install with: pip install openai")
+        self._client_cls = AsyncOpenAI
 
         self.model = config.vision_model  # GPT-4 Vision Language Model
+
+    def _create_client(self):
+        """Create an OpenAI client with its own pooled HTTP connections"""
+        return self._client_cls(api_key=self.config.openai_api_key, http_client=create_http_client())
     
     async def process_text_messages(
         self,
         messages: List[Dict[str, Any]],
         max_tokens: int = 300,
-        temperature: float = 0.3
+        temperature: float = 0.3,
+        json_mode: bool = False
     ) -> str:
         """Process text-only messages through OpenAI's Language Model"""
         try:
+            cache_key = self._response_cache_key(self.config.model, messages, max_tokens, json_mode, temperature=temperature)
+            cached = self._get_cached_response(cache_key)
+            if cached is not None:
+                return cached
+
             response = await self.client.chat.completions.create(
                 model=self.config.model,
-                messages=messages,
+                messages=self._apply_cache_hints(messages, self.config.model),
                 max_tokens=max_tokens,
-                temperature=temperature
+                temperature=temperature,
+                **self._response_format_kwargs(json_mode)
             )
             
             content = response.choices[0].message.content
@@ -57,28 +67,60 @@ class OpenAIProvider(BaseProvider):
             result = content.strip()
             logger.debug(f"OpenAI text response: {result[:50]}...")
 
+            self.response_cache.put(cache_key, result)
             return result
             
         except Exception as e:
             logger.error(f"OpenAI text processing failed: {e}")
             raise ProviderError(f"Text processing failed: {e}", "openai")
     
-    async def process_multimodal_messages(
+    async def process_text_messages_stream(
         self,
         messages: List[Dict[str, Any]],
         max_tokens: int = 300,
         temperature: float = 0.3
+    ) -> AsyncIterator[str]:
+        """Stream text-only message output from OpenAI's Language Model as it is generated"""
+        try:
+            stream = await self.client.chat.completions.create(
+                model=self.config.model,
+                messages=self._apply_cache_hints(messages, self.config.model),
+                max_tokens=max_tokens,
+                temperature=temperature,
+                stream=True
+            )
+
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+
+        except Exception as e:
+            logger.error(f"OpenAI text streaming failed: {e}")
+            raise ProviderError(f"Text streaming failed: {e}", "openai")
+    
+    async def process_multimodal_messages(
+        self,
+        messages: List[Dict[str, Any]],
+        max_tokens: int = 300,
+        temperature: float = 0.3,
+        json_mode: bool = False
     ) -> str:
         """Process multimodal messages through OpenAI GPT-4 Vision Language Model"""
         try:
             # Process messages for Vision Language Model input
-            processed_messages = self._prepare_openai_messages(messages)
+            processed_messages = await self._prepare_openai_messages(messages)
+
+            cache_key = self._response_cache_key(self.model, processed_messages, max_tokens, json_mode, temperature=temperature)
+            cached = self._get_cached_response(cache_key)
+            if cached is not None:
+                return cached
 
             response = await self.client.chat.completions.create(
                 model=self.model,  # GPT-4 Vision Language Model
-                messages=processed_messages,
+                messages=self._apply_cache_hints(processed_messages, self.model),
                 max_tokens=max_tokens,
-                temperature=temperature
+                temperature=temperature,
+                **self._response_format_kwargs(json_mode)
             )
             
             content = response.choices[0].message.content
@@ -89,51 +131,35 @@ class OpenAIProvider(BaseProvider):
             result = content.strip()
             logger.debug(f"OpenAI multimodal response: {result[:50]}...")
 
+            self.response_cache.put(cache_key, result)
             return result
             
         except Exception as e:
             logger.error(f"OpenAI multimodal processing failed: {e}")
             raise ProviderError(f"Multimodal processing failed: {e}", "openai")
-    
-    def _prepare_openai_messages(self, messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Prepare messages for OpenAI Vision Language Model by converting image paths to data URLs"""
-        processed_messages = []
-        
-        for message in messages:
-            if message["role"] == "system":
-                # System messages remain text-only
-                processed_messages.append(message)
-            elif message["role"] == "user" and isinstance(message["content"], list):
-                # User message with multimodal content for Vision Language Model
-                processed_content = []
-
-                for content_item in message["content"]:
-                    if content_item["type"] == "text":
-                        processed_content.append(content_item)
-                    elif content_item["type"] == "image_path":
-                        # Convert image path to Vision Language Model format
-                        image_path = content_item["image_path"]
-                        if self._validate_image_path(image_path):
-                            image_data_url = self._create_image_data_url(image_path)
-                            processed_content.append({
-                                "type": "image_url",
-                                "image_url": {
-                                    "url": image_data_url,
-                                    "detail": content_item.get("detail", "high")
-                                }
-                            })
-                        else:
-                            logger.warning(f"Skipping invalid image path for Vision Language Model: {image_path}")
-                    else:
-                        # Pass through other content types to Vision Language Model
-                        processed_content.append(content_item)
-                
-                processed_messages.append({
-                    "role": message["role"],
-                    "content": processed_content
-                })
-            else:
-                # Regular text message
-                processed_messages.append(message)
-        
-        return processed_messages
\ No newline at end of file
+
+    async def process_multimodal_messages_stream(
+        self,
+        messages: List[Dict[str, Any]],
+        max_tokens: int = 300,
+        temperature: float = 0.3
+    ) -> AsyncIterator[str]:
+        """Stream multimodal message output from OpenAI GPT-4 Vision Language Model as it is generated"""
+        try:
+            processed_messages = await self._prepare_openai_messages(messages)
+
+            stream = await self.client.chat.completions.create(
+                model=self.model,
+                messages=self._apply_cache_hints(processed_messages, self.model),
+                max_tokens=max_tokens,
+                temperature=temperature,
+                stream=True
+            )
+
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+
+        except Exception as e:
+            logger.error(f"OpenAI multimodal streaming failed: {e}")
+            raise ProviderError(f"Multimodal streaming failed: {e}", "openai")
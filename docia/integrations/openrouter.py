@@ -6,20 +6,29 @@ Uses OpenAI-compatible API with OpenRouter's unified endpoint.
 """
 
 import logging
-from typing import List, Dict, Any
+from typing import List, Dict, Any, AsyncIterator
 
-from .base import BaseProvider, ProviderError
+from .base import BaseProvider, ProviderError, create_http_client
 from ..core.config import DociaConfig
 
 logger = logging.getLogger(__name__)
 
-
 class OpenRouterProvider(BaseProvider):
     """OpenRouter Multi-Vision Language Model provider
 
     Provides access to multiple Vision Language Models through OpenRouter's unified API.
     """
 
+    # Asks OpenRouter to report usage (including cost) with each response
+    _EXTRA_BODY = {
+        "usage": {
+            "include": True,
+        },
+    }
+
+    # Model families OpenRouter forwards cache_control breakpoints to
+    _CACHE_CONTROL_MODELS = ("anthropic/",)
+
     def __init__(self, config: DociaConfig):
         super().__init__(config)
 
@@ -29,33 +38,47 @@ class OpenRouterProvider(BaseProvider):
         # Import OpenAI client for Vision Language Model operations
         try:
             from openai import AsyncOpenAI
-            self.client = AsyncOpenAI(
-                api_key=config.openrouter_api_key,
-                base_url="https://openrouter.ai/api/v1"
-            )
         except ImportError:
             raise ImportError("OpenAI library required for Vision Language Model operations. Install with: pip install openai")
+        self._client_cls = AsyncOpenAI
 
         self.model = config.vision_model  # Selected Vision Language Model
 
+    def _create_client(self):
+        """Create an OpenRouter client with its own pooled HTTP connections"""
+        return self._client_cls(
+            api_key=self.config.openrouter_api_key,
+            base_url="https://openrouter.ai/api/v1",
+            http_client=create_http_client()
+        )
+
+    def _apply_cache_hints(self, messages: List[Dict[str, Any]], model: str) -> List[Dict[str, Any]]:
+        """Keep cache_control breakpoints for models with explicit prompt caching"""
+        if model.startswith(self._CACHE_CONTROL_MODELS):
+            return messages
+        return super()._apply_cache_hints(messages, model)
+
     async def process_text_messages(
         self,
         messages: List[Dict[str, Any]],
         max_tokens: int = 300,
-        temperature: float = 0.3
+        temperature: float = 0.3,
+        json_mode: bool = False
     ) -> str:
         """Process text-only messages through OpenRouter's Language Model access"""
         try:
+            cache_key = self._response_cache_key(self.config.model, messages, max_tokens, json_mode, temperature=temperature)
+            cached = self._get_cached_response(cache_key)
+            if cached is not None:
+                return cached
+
             response = await self.client.chat.completions.create(
                 model=self.config.model,
-                messages=messages,
+                messages=self._apply_cache_hints(messages, self.config.model),
                 max_tokens=max_tokens,
                 temperature=temperature,
-                extra_body= {
-                      "usage": {
-                        "include": True,
-                      },
-                },
+                extra_body=self._EXTRA_BODY,
+                **self._response_format_kwargs(json_mode),
             )
 
             content = response.choices[0].message.content
@@ -74,33 +97,70 @@ class OpenRouterProvider(BaseProvider):
             else:
                 self.last_api_cost = None
 
+            self.response_cache.put(cache_key, result)
             return result
 
         except Exception as e:
             logger.error(f"OpenRouter text processing failed: {e}")
             raise ProviderError(f"Text processing failed: {e}", "openrouter")
 
-    async def process_multimodal_messages(
+    async def process_text_messages_stream(
         self,
         messages: List[Dict[str, Any]],
         max_tokens: int = 300,
         temperature: float = 0.3
+    ) -> AsyncIterator[str]:
+        """Stream text-only message output from OpenRouter's Language Model access as it is generated"""
+        try:
+            self.last_api_cost = None
+            stream = await self.client.chat.completions.create(
+                model=self.config.model,
+                messages=self._apply_cache_hints(messages, self.config.model),
+                max_tokens=max_tokens,
+                temperature=temperature,
+                stream=True,
+                extra_body=self._EXTRA_BODY,
+            )
+
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+
+                # Usage (with cost) arrives on the final chunk
+                usage = getattr(chunk, 'usage', None)
+                if usage is not None and getattr(usage, 'cost', None) is not None:
+                    self.last_api_cost = usage.cost
+                    self.total_cost += usage.cost
+                    logger.debug(f"OpenRouter Vision Language Model cost: ${usage.cost}")
+
+        except Exception as e:
+            logger.error(f"OpenRouter text streaming failed: {e}")
+            raise ProviderError(f"Text streaming failed: {e}", "openrouter")
+
+    async def process_multimodal_messages(
+        self,
+        messages: List[Dict[str, Any]],
+        max_tokens: int = 300,
+        temperature: float = 0.3,
+        json_mode: bool = False
     ) -> str:
         """Process multimodal messages through OpenRouter's Vision Language Model access"""
         try:
             # Process messages for Vision Language Model input
-            processed_messages = self._prepare_openai_messages(messages)
+            processed_messages = await self._prepare_openai_messages(messages)
+
+            cache_key = self._response_cache_key(self.model, processed_messages, max_tokens, json_mode, temperature=temperature)
+            cached = self._get_cached_response(cache_key)
+            if cached is not None:
+                return cached
 
             response = await self.client.chat.completions.create(
                 model=self.model,  # Selected Vision Language Model
-                messages=processed_messages,
+                messages=self._apply_cache_hints(processed_messages, self.model),
                 max_tokens=max_tokens,
                 temperature=temperature,
-                extra_body={
-                    "usage": {
-                        "include": True,
-                    },
-                },
+                extra_body=self._EXTRA_BODY,
+                **self._response_format_kwargs(json_mode),
             )
 
             content = response.choices[0].message.content
@@ -119,51 +179,44 @@ class OpenRouterProvider(BaseProvider):
             else:
                 self.last_api_cost = None
 
+            self.response_cache.put(cache_key, result)
             return result
 
         except Exception as e:
             logger.error(f"OpenRouter multimodal processing failed: {e}")
             raise ProviderError(f"Multimodal processing failed: {e}", "openrouter")
 
-    def _prepare_openai_messages(self, messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Prepare messages for OpenRouter Vision Language Model by converting image paths to data URLs"""
-        processed_messages = []
-
-        for message in messages:
-            if message["role"] == "system":
-                # System messages remain text-only
-                processed_messages.append(message)
-            elif message["role"] == "user" and isinstance(message["content"], list):
-                # User message with multimodal content for Vision Language Model
-                processed_content = []
-
-                for content_item in message["content"]:
-                    if content_item["type"] == "text":
-                        processed_content.append(content_item)
-                    elif content_item["type"] == "image_path":
-                        # Convert image path to OpenRouter Vision Language Model format
-                        image_path = content_item["image_path"]
-                        if self._validate_image_path(image_path):
-                            image_data_url = self._create_image_data_url(image_path)
-                            processed_content.append({
-                                "type": "image_url",
-                                "image_url": {
-                                    "url": image_data_url,
-                                    "detail": content_item.get("detail", "high")
-                                }
-                            })
-                        else:
-                            logger.warning(f"Skipping invalid image path for Vision Language Model: {image_path}")
-                    else:
-                        # Pass through other content types to Vision Language Model
-                        processed_content.append(content_item)
-
-                processed_messages.append({
-                    "role": message["role"],
-                    "content": processed_content
-                })
-            else:
-                # Regular text message
-                processed_messages.append(message)
+    async def process_multimodal_messages_stream(
+        self,
+        messages: List[Dict[str, Any]],
+        max_tokens: int = 300,
+        temperature: float = 0.3
+    ) -> AsyncIterator[str]:
+        """Stream multimodal message output from OpenRouter's Vision Language Model access as it is generated"""
+        try:
+            self.last_api_cost = None
+            processed_messages = await self._prepare_openai_messages(messages)
 
-        return processed_messages
+            stream = await self.client.chat.completions.create(
+                model=self.model,  # Selected Vision Language Model
+                messages=self._apply_cache_hints(processed_messages, self.model),
+                max_tokens=max_tokens,
+                temperature=temperature,
+                stream=True,
+                extra_body=self._EXTRA_BODY,
+            )
+
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+
+                # Usage (with cost) arrives on the final chunk
+                usage = getattr(chunk, 'usage', None)
+                if usage is not None and getattr(usage, 'cost', None) is not None:
+                    self.last_api_cost = usage.cost
+                    self.total_cost += usage.cost
+                    logger.debug(f"OpenRouter Vision Language Model cost: ${usage.cost}")
+
+        except Exception as e:
+            logger.error(f"OpenRouter multimodal streaming failed: {e}")
+            raise ProviderError(f"Multimodal streaming failed: {e}", "openrouter")
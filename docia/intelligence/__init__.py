@@ -4,8 +4,8 @@
 from .prompts import (
     SYSTEM_DOCIA, SYSTEM_SYNTHESIS, SYSTEM_QUERY_REFORMULATOR,
     SYSTEM_QUERY_CLASSIFIER, SYSTEM_ADAPTIVE_PLANNER, SYSTEM_PAGE_SELECTOR,
-    TASK_PROCESSING_PROMPT, SYNTHESIS_PROMPT, ADAPTIVE_INITIAL_PLANNING_PROMPT,
-    ADAPTIVE_PLAN_UPDATE_PROMPT, VISION_PAGE_SELECTION_PROMPT,
+    TASK_PROCESSING_PROMPT, SYNTHESIS_PROMPT, ADAPTIVE_PLANNING_EXAMPLES,
+    ADAPTIVE_PLANNING_DOCUMENTS, ADAPTIVE_PLANNING_TAIL, ADAPTIVE_PLAN_UPDATE_PROMPT, VISION_PAGE_SELECTION_PROMPT,
     QUERY_REFORMULATION_PROMPT, CONVERSATION_SUMMARIZATION_PROMPT,
     QUERY_CLASSIFICATION_PROMPT
 )
@@ -13,8 +13,8 @@ from .prompts import (
 __all__ = [
     "SYSTEM_DOCIA", "SYSTEM_SYNTHESIS", "SYSTEM_QUERY_REFORMULATOR",
     "SYSTEM_QUERY_CLASSIFIER", "SYSTEM_ADAPTIVE_PLANNER", "SYSTEM_PAGE_SELECTOR",
-    "TASK_PROCESSING_PROMPT", "SYNTHESIS_PROMPT", "ADAPTIVE_INITIAL_PLANNING_PROMPT",
-    "ADAPTIVE_PLAN_UPDATE_PROMPT", "VISION_PAGE_SELECTION_PROMPT",
+    "TASK_PROCESSING_PROMPT", "SYNTHESIS_PROMPT", "ADAPTIVE_PLANNING_EXAMPLES",
+    "ADAPTIVE_PLANNING_DOCUMENTS", "ADAPTIVE_PLANNING_TAIL", "ADAPTIVE_PLAN_UPDATE_PROMPT", "VISION_PAGE_SELECTION_PROMPT",
     "QUERY_REFORMULATION_PROMPT", "CONVERSATION_SUMMARIZATION_PROMPT",
     "QUERY_CLASSIFICATION_PROMPT"
 ]
\ No newline at end of file
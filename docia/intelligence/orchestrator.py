@@ -4,15 +4,19 @@ Docia Vision Intelligence Orchestrator
 Core engine for adaptive document intelligence with Vision AI processing.
 """
 
+import asyncio
+import dataclasses
+import itertools
+import re
 import time
 import logging
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 
 from ..models.agent import (
     ConversationMessage, TaskPlan, TaskResult, AgentQueryResult, TaskStatus
 )
 from ..models.document import Document, Page
-from ..integrations.base import BaseProvider
+from ..integrations.base import BaseProvider, ResponseCache, CACHE_CONTROL
 from ..storage.base import BaseStorage
 from ..core.config import DociaConfig
 from ..exceptions import (
@@ -27,11 +31,77 @@ from .task_management.page_selector import PageSelector
 from .task_management.synthesizer import ResponseSynthesizer
 from .prompts import (
     TASK_PROCESSING_PROMPT, SYSTEM_DOCIA,
-    BASIC_GUIDELINES, TABLE_GUIDELINES, CHART_GUIDELINES, IMAGE_GUIDELINES
+    BASIC_GUIDELINES, GUIDELINES
 )
 
 logger = logging.getLogger(__name__)
 
+# Prefix of the analysis text recorded for a task that raised
+TASK_FAILURE_PREFIX = "Intelligence task execution failed"
+
+# Prefix of the analysis text recorded when a task's vision call raised
+ANALYSIS_FAILURE_PREFIX = "Vision AI analysis failed"
+
+# Greetings and pleasantries answered without asking the classifier
+_SMALL_TALK_RE = re.compile(
+    r"^\s*(hi|hello|hey|thanks|thank you|thx|ok|okay|bye|goodbye)\b[\s!.?]*$",
+    re.IGNORECASE
+)
+
+
+class _UpdateDispatcher:
+    """Deliver progress events to a callback in order, off the pipeline's critical path
+
+    Awaiting the dispatcher only queues the event. A worker delivers the
+    queued events, coalescing what piled up while the callback was busy:
+    answer chunks are joined and superseded plan updates are dropped.
+    """
+
+    def __init__(self, callback: Any):
+        self._callback = callback
+        self._queue: "asyncio.Queue[Optional[Tuple[str, Any]]]" = asyncio.Queue()
+        self._worker = asyncio.ensure_future(self._drain())
+
+    async def __call__(self, event_type: str, data: Any):
+        self._queue.put_nowait((event_type, data))
+
+    async def _drain(self):
+        while True:
+            events = [await self._queue.get()]
+            while not self._queue.empty():
+                events.append(self._queue.get_nowait())
+
+            for event in self._coalesce(events):
+                if event is None:
+                    return
+                try:
+                    await self._callback(*event)
+                except Exception as e:
+                    logger.warning(f"Task update callback failed for {event[0]}: {e}")
+
+    @staticmethod
+    def _coalesce(events: List[Optional[Tuple[str, Any]]]) -> List[Optional[Tuple[str, Any]]]:
+        """Merge adjacent answer chunks and keep only the latest plan update"""
+        last_plan_update = max(
+            (i for i, event in enumerate(events) if event and event[0] == 'plan_updated'),
+            default=None
+        )
+        coalesced = []
+        for i, event in enumerate(events):
+            if event and event[0] == 'plan_updated' and i != last_plan_update:
+                continue
+            if (event and event[0] == 'answer_chunk' and coalesced
+                    and coalesced[-1] and coalesced[-1][0] == 'answer_chunk'):
+                coalesced[-1] = ('answer_chunk', {'text': coalesced[-1][1]['text'] + event[1]['text']})
+                continue
+            coalesced.append(event)
+        return coalesced
+
+    async def aclose(self):
+        """Deliver every queued event, then stop the worker"""
+        self._queue.put_nowait(None)
+        await self._worker
+
 
 class Orchestrator:
     """
@@ -67,15 +137,40 @@ class Orchestrator:
         self.page_selector = PageSelector(provider, config)
         self.synthesizer = ResponseSynthesizer(provider)
 
+        # Complete answers, reused while the question and knowledge base are unchanged
+        self.result_cache = ResponseCache(config.result_cache_size)
+
         logger.info("Docia Vision Intelligence Engine initialized")
 
-    def _accumulate_cost(self, total_cost: float) -> float:
-        """Accumulate Vision AI processing cost"""
-        if hasattr(self.provider, 'get_last_cost'):
-            last_cost = self.provider.get_last_cost()
-            if last_cost is not None:
-                return total_cost + last_cost
-        return total_cost
+    def _cost_since(self, cost_baseline: float) -> float:
+        """Vision AI processing cost accumulated by the provider since cost_baseline
+
+        Provider calls overlap, so the cost of the last call alone can't be
+        attributed to a step; the running total can.
+        """
+        return self.provider.get_total_cost() - cost_baseline
+
+    async def _resolve_query(
+        self,
+        query: str,
+        conversation_history: Optional[List[ConversationMessage]]
+    ) -> str:
+        """Rewrite a follow-up query as a standalone one using the conversation context"""
+        if not conversation_history:
+            return query
+
+        # Step 1: Context Processing (conversation summarization if needed)
+        processed_context, _ = await self.context_processor.process_conversation_context(
+            conversation_history, query
+        )
+        logger.info("Processed conversation context")
+
+        # Step 2: Query Reformulation
+        reformulated_query = await self.query_reformulator.reformulate_with_context(
+            query, processed_context
+        )
+        logger.info(f"Reformulated query: '{query}' → '{reformulated_query}'")
+        return reformulated_query
 
     async def process_query(
         self,
@@ -94,33 +189,33 @@ class Orchestrator:
             Comprehensive AgentQueryResult with intelligence insights
         """
         start_time = time.time()
-        total_cost = 0.0  # Track total cost for this query
+        cost_baseline = self.provider.get_total_cost()  # Track total cost for this query
+
+        # Progress events are queued so a slow callback doesn't stall the pipeline
+        dispatcher = None
+        if task_update_callback:
+            task_update_callback = dispatcher = _UpdateDispatcher(task_update_callback)
 
         try:
             logger.info(f"Processing query: {query[:100]}...")
 
-            # Step 1: Context Processing (conversation summarization if needed)
-            processed_context = ""
-            display_messages = conversation_history or []
+            # Small talk never needs documents; skip the classification call
+            if _SMALL_TALK_RE.match(query):
+                return self._create_direct_answer_result(query, "The message is small talk.")
 
-            if conversation_history:
-                processed_context, display_messages = await self.context_processor.process_conversation_context(
-                    conversation_history, query
-                )
-                total_cost = self._accumulate_cost(total_cost)
-                logger.info("Processed conversation context")
-
-            # Step 2: Query Reformulation (if conversation context exists)
-            reformulated_query = query
-            if conversation_history:
-                reformulated_query = await self.query_reformulator.reformulate_with_context(
-                    query, processed_context
-                )
-                logger.info(f"Reformulated query: '{query}' → '{reformulated_query}'")
+            # Steps 1-3: Context processing and reformulation run alongside
+            # classification of the query as asked
+            reformulated_query, classification = await asyncio.gather(
+                self._resolve_query(query, conversation_history),
+                self.query_classifier.classify_query(query)
+            )
 
-            # Step 3: Query Classification
-            classification = await self.query_classifier.classify_query(reformulated_query)
-            total_cost = self._accumulate_cost(total_cost)
+            # A follow-up like "and the second one?" may only read as a document
+            # question once reformulated, so re-check it in that form
+            if not classification["needs_documents"] and reformulated_query.strip() != query.strip():
+                classification = await self.query_classifier.classify_query(reformulated_query)
+
+            total_cost = self._cost_since(cost_baseline)
             logger.info(f"Query classification: {classification['reasoning']}")
 
             # If query doesn't need documents, return direct answer
@@ -136,6 +231,25 @@ class Orchestrator:
 
             logger.info(f"Found {len(documents)} documents")
 
+            # Conversation memory shared by every task's page analysis
+            memory_summary = self._build_memory_summary(conversation_history)
+
+            # An identical question over the same documents gets the same answer
+            result_key = self.result_cache.make_key(
+                reformulated_query,
+                memory_summary,
+                self._knowledge_base_version(documents)
+            )
+            cached_result = self.result_cache.get(result_key)
+            if cached_result is not None:
+                logger.info("Serving query result from cache")
+                return dataclasses.replace(
+                    cached_result,
+                    query=query,
+                    processing_time_seconds=time.time() - start_time,
+                    total_cost=self._cost_since(cost_baseline)
+                )
+
             # Step 5: Task Planning + Document Selection (merged)
             task_plan = await self.planner.create_initial_plan(reformulated_query, documents)
 
@@ -145,20 +259,25 @@ class Orchestrator:
 
             # Step 6: Execute tasks adaptively
             task_results = await self._execute_adaptive_plan(
-                task_plan, reformulated_query, documents, conversation_history, task_update_callback
+                task_plan, reformulated_query, documents, memory_summary, task_update_callback
             )
             
-            # Accumulate any costs from task execution
-            total_cost = self._accumulate_cost(total_cost)
+            # Step 7: Synthesize final response, reporting answer text as it streams in
+            on_chunk = None
+            if task_update_callback:
+                async def on_chunk(text: str):
+                    await task_update_callback('answer_chunk', {'text': text})
 
-            # Step 7: Synthesize final response
-            final_answer = await self.synthesizer.synthesize_response(reformulated_query, task_results)
+            final_answer = await self.synthesizer.synthesize_response(
+                reformulated_query, task_results, on_chunk=on_chunk
+            )
 
             # Step 8: Build final result
+            total_cost = self._cost_since(cost_baseline)
             processing_time = time.time() - start_time
-            all_selected_pages = []
-            for result in task_results:
-                all_selected_pages.extend(result.selected_pages)
+            all_selected_pages = list(itertools.chain.from_iterable(
+                result.selected_pages for result in task_results
+            ))
 
             result = AgentQueryResult(
                 query=query,
@@ -170,6 +289,12 @@ class Orchestrator:
                 total_cost=total_cost  # Always include cost, even if 0
             )
 
+            # Answers built on failed tasks are worth retrying rather than reusing
+            if not any(
+                r.analysis.startswith((TASK_FAILURE_PREFIX, ANALYSIS_FAILURE_PREFIX))
+                for r in task_results
+            ):
+                self.result_cache.put(result_key, result)
             logger.info(f"Query processed successfully in {processing_time:.2f}s")
             return result
 
@@ -178,58 +303,87 @@ class Orchestrator:
             processing_time = time.time() - start_time
             return self._create_error_result(query, str(e), processing_time)
 
+        finally:
+            if dispatcher is not None:
+                await dispatcher.aclose()
+
     async def _execute_adaptive_plan(
         self,
         task_plan: TaskPlan,
         original_query: str,
         documents: List[Document],
-        conversation_history: Optional[List[ConversationMessage]] = None,
+        memory_summary: str,
         task_update_callback: Optional[Any] = None
     ) -> List[TaskResult]:
-        """Execute adaptive intelligence plan with dynamic replanning"""
+        """Execute adaptive intelligence plan with dynamic replanning
+
+        The pending tasks are analyzed together and the plan is re-evaluated
+        after each batch while the iteration budget allows. Page selection and vision analysis are limited to
+        max_task_concurrency calls each, separately, so one task's selection
+        can proceed while others hold every analysis slot.
+        """
         task_results = []
         iteration = 0
+        selection_slots = asyncio.Semaphore(self.config.max_task_concurrency)
+        analysis_slots = asyncio.Semaphore(self.config.max_task_concurrency)
 
-        while (task_plan.has_pending_tasks() and
-               iteration < self.config.max_agent_iterations):
-
-            iteration += 1
-            logger.info(f"Vision intelligence iteration {iteration}")
+        # Page selections by (document, task name, task description); tasks that
+        # repeat one share a single selection call, even while it is in flight
+        selections: Dict[Tuple[str, str, str], "asyncio.Future[List[Page]]"] = {}
 
-            # Get next task to execute
-            current_task = task_plan.get_next_pending_task()
-            if not current_task:
-                break
+        # Task document lookups, built once for the whole plan
+        doc_index = {doc.id: doc for doc in documents}
+        all_pages = [page for doc in documents for page in doc.pages]
 
-            logger.info(f"Executing task: {current_task.name}")
-            current_task.status = TaskStatus.IN_PROGRESS
+        async def run_task(task: Any) -> TaskResult:
+            logger.info(f"Executing task: {task.name}")
 
             # Report task starting
             if task_update_callback:
-                await task_update_callback('task_started', {'task': current_task, 'plan': task_plan})
+                await task_update_callback('task_started', {'task': task, 'plan': task_plan})
 
             # Execute the task
             task_result = await self._execute_single_task(
-                current_task, documents, original_query, conversation_history, task_update_callback
+                task, doc_index, all_pages, original_query, memory_summary, task_update_callback,
+                selection_slots=selection_slots, analysis_slots=analysis_slots, selections=selections
             )
 
             # Mark task completed
-            current_task.status = TaskStatus.COMPLETED
-            task_results.append(task_result)
+            task.status = TaskStatus.COMPLETED
 
-            logger.info(f"Intelligence task completed: {current_task.name} "
+            logger.info(f"Intelligence task completed: {task.name} "
                        f"(analyzed {task_result.pages_analyzed} pages)")
 
             # Report task completion
             if task_update_callback:
-                await task_update_callback('task_completed', {'task': current_task, 'result': task_result, 'plan': task_plan})
+                await task_update_callback('task_completed', {'task': task, 'result': task_result, 'plan': task_plan})
 
-            # Update intelligence plan adaptively
-            if task_plan.has_pending_tasks():
+            return task_result
+
+        while (task_plan.has_pending_tasks() and
+               iteration < self.config.max_agent_iterations):
+
+            # Take every pending task the iteration budget allows
+            batch = [
+                task for task in task_plan.tasks if task.status == TaskStatus.PENDING
+            ][:self.config.max_agent_iterations - iteration]
+            iteration += len(batch)
+            logger.info(f"Vision intelligence iteration {iteration}: {len(batch)} tasks")
+
+            for task in batch:
+                task.status = TaskStatus.IN_PROGRESS
+
+            batch_results = await asyncio.gather(*(run_task(task) for task in batch))
+            task_results.extend(batch_results)
+
+            # Update intelligence plan adaptively while iterations remain; the
+            # batch takes every pending task, so the planner is asked even when
+            # none are left and may add follow-up tasks
+            if iteration < self.config.max_agent_iterations:
                 logger.info("Evaluating intelligence plan for updates...")
                 old_task_count = len(task_plan.tasks)
                 task_plan = await self.planner.update_plan(
-                    task_plan, task_result, original_query, documents
+                    task_plan, list(batch_results), original_query, documents
                 )
 
                 # Report intelligence plan update
@@ -243,10 +397,15 @@ class Orchestrator:
     async def _execute_single_task(
         self,
         task: Any,  # AgentTask
-        documents: List[Document],
+        doc_index: Dict[str, Document],
+        all_pages: List[Page],
         original_query: str,
-        conversation_history: Optional[List[ConversationMessage]] = None,
-        task_update_callback: Optional[Any] = None
+        memory_summary: str,
+        task_update_callback: Optional[Any] = None,
+        *,
+        selection_slots: asyncio.Semaphore,
+        analysis_slots: asyncio.Semaphore,
+        selections: Dict[Tuple[str, str, str], "asyncio.Future[List[Page]]"]
     ) -> TaskResult:
         """Execute single intelligence task: document filtering + page selection + Vision AI analysis"""
         try:
@@ -254,7 +413,7 @@ class Orchestrator:
             task_pages = []
             if task.document:
                 # Find document assigned to this intelligence task
-                task_doc = next((doc for doc in documents if doc.id == task.document), None)
+                task_doc = doc_index.get(task.document)
                 if task_doc:
                     task_pages = task_doc.pages
                     logger.info(f"Intelligence task {task.name} assigned to document: {task_doc.name} ({len(task_pages)} pages)")
@@ -262,17 +421,18 @@ class Orchestrator:
                     logger.warning(f"Intelligence task {task.name} assigned to document {task.document} but document not found")
             else:
                 # Fallback: use all pages for intelligence analysis
-                task_pages = []
-                for doc in documents:
-                    task_pages.extend(doc.pages)
+                task_pages = all_pages
                 logger.warning(f"Intelligence task {task.name} has no document assignment, using all pages")
 
             # Phase 2: Intelligent Page Selection
-            selected_pages = await self.page_selector.select_pages_for_task(
-                query=task.name,
-                query_description=task.description,
-                task_pages=task_pages
-            )
+            selection_key = (task.document, task.name, task.description)
+            selection = selections.get(selection_key)
+            if selection is None:
+                selection = asyncio.ensure_future(
+                    self._select_task_pages(task, task_pages, selection_slots)
+                )
+                selections[selection_key] = selection
+            selected_pages = await selection
 
             # Ensure selected_pages is not None
             if selected_pages is None:
@@ -287,9 +447,10 @@ class Orchestrator:
                 await task_update_callback('pages_selected', {'task': task, 'page_numbers': page_numbers})
 
             # Phase 3: Vision AI Analysis
-            analysis = await self._analyze_pages_for_task(
-                task, selected_pages, original_query, conversation_history
-            )
+            async with analysis_slots:
+                analysis = await self._analyze_pages_for_task(
+                    task, selected_pages, original_query, memory_summary
+                )
 
             # Ensure analysis is not None
             if analysis is None:
@@ -309,7 +470,21 @@ class Orchestrator:
             return TaskResult(
                 task=task,
                 selected_pages=[],
-                analysis=f"Intelligence task execution failed: {e}"
+                analysis=f"{TASK_FAILURE_PREFIX}: {e}"
+            )
+
+    async def _select_task_pages(
+        self,
+        task: Any,  # AgentTask
+        task_pages: List[Page],
+        selection_slots: asyncio.Semaphore
+    ) -> List[Page]:
+        """Select the pages relevant to a task, within the plan's selection concurrency"""
+        async with selection_slots:
+            return await self.page_selector.select_pages_for_task(
+                query=task.name,
+                query_description=task.description,
+                task_pages=task_pages
             )
 
     async def _analyze_pages_for_task(
@@ -317,62 +492,15 @@ class Orchestrator:
         task: Any,  # AgentTask
         pages: List[Page],
         original_query: str,
-        conversation_history: Optional[List[ConversationMessage]] = None
+        memory_summary: str
     ) -> str:
         """Analyze pages with Vision AI to complete intelligence task"""
         if not pages:
             return f"No relevant pages found for intelligence task: {task.name}"
 
         try:
-            # Build intelligence memory from conversation
-            memory_summary = self._build_memory_summary(conversation_history)
-
-            # Select specialized analysis guidelines based on information type
-            information_type = getattr(task, 'information_type', 'basic')
-            guidelines_map = {
-                'basic': BASIC_GUIDELINES,
-                'table': TABLE_GUIDELINES,
-                'chart': CHART_GUIDELINES,
-                'image': IMAGE_GUIDELINES
-            }
-            analysis_guidelines = guidelines_map.get(information_type, BASIC_GUIDELINES)
-
-            # Create intelligence processing prompt with specialized guidelines
-            prompt = TASK_PROCESSING_PROMPT.format(
-                task_description=task.description,
-                information_type=information_type,
-                search_queries=task.description,  # Use task description for intelligence focus
-                memory_summary=memory_summary,
-                analysis_guidelines=analysis_guidelines
-            )
-
-            # Build multimodal message with selected page images
-            messages = [
-                {"role": "system", "content": SYSTEM_DOCIA},
-                {
-                    "role": "user",
-                    "content": [
-                        {
-                            "type": "text",
-                            "text": prompt
-                        }
-                    ]
-                }
-            ]
-
-            # Add page images to message
-            for i, page in enumerate(pages, 1):
-                messages[1]["content"].extend([
-                    {
-                        "type": "image_path",
-                        "image_path": page.image_path,
-                        "detail": "high"  # Use high detail for task analysis
-                    },
-                    {
-                        "type": "text",
-                        "text": f"[Page {i} from document]"
-                    }
-                ])
+            # Page images are read and encoded by the provider in its executor
+            messages = self._build_vision_messages(task, pages, memory_summary)
 
             # Process with vision model
             result = await self.provider.process_multimodal_messages(
@@ -390,7 +518,63 @@ class Orchestrator:
 
         except Exception as e:
             logger.error(f"Vision AI analysis failed for task {task.name}: {e}")
-            return f"Vision AI analysis failed for intelligence task {task.name}: {e}"
+            return f"{ANALYSIS_FAILURE_PREFIX} for intelligence task {task.name}: {e}"
+
+    def _build_vision_messages(
+        self,
+        task: Any,  # AgentTask
+        pages: List[Page],
+        memory_summary: str
+    ) -> List[Dict[str, Any]]:
+        """Build the multimodal messages for a task's page analysis"""
+        # Select specialized analysis guidelines based on information type
+        information_type = getattr(task, 'information_type', 'basic')
+        analysis_guidelines = GUIDELINES.get(information_type, BASIC_GUIDELINES)
+
+        # Create intelligence processing prompt with specialized guidelines
+        prompt = TASK_PROCESSING_PROMPT.format(
+            task_description=task.description,
+            information_type=information_type,
+            search_queries=task.description,  # Use task description for intelligence focus
+            memory_summary=memory_summary,
+            analysis_guidelines=analysis_guidelines
+        )
+
+        # Build multimodal message with the page images ahead of the task prompt,
+        # so calls over the same pages share a cacheable prompt prefix
+        user_content = []
+        for i, page in enumerate(pages, 1):
+            user_content.extend([
+                {
+                    "type": "image_path",
+                    "image_path": page.image_path,
+                    "detail": "high"  # Use high detail for task analysis
+                },
+                {
+                    "type": "text",
+                    "text": f"[Page {i} from document]"
+                }
+            ])
+        if user_content:
+            # Tasks over the same pages can reuse the provider's cache of this prefix
+            user_content[-1]["cache_control"] = CACHE_CONTROL
+        user_content.append({
+            "type": "text",
+            "text": prompt
+        })
+
+        return [
+            {"role": "system", "content": SYSTEM_DOCIA},
+            {"role": "user", "content": user_content}
+        ]
+
+    @staticmethod
+    def _knowledge_base_version(documents: List[Document]) -> List[List[Any]]:
+        """Identify the state of the knowledge base; changes when documents are added, removed or re-summarized"""
+        return sorted(
+            [doc.id, doc.created_at.isoformat(), len(doc.pages), doc.summary or ""]
+            for doc in documents
+        )
 
     def _build_memory_summary(
         self,
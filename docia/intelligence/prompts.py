@@ -2,6 +2,8 @@
 AI prompts for Docia adaptive RAG agent
 """
 
+from types import MappingProxyType
+
 # Specialized analysis guidelines for different information types
 BASIC_GUIDELINES = """You are analyzing general text content such as policies, descriptions, or explanations.
 
@@ -62,6 +64,14 @@ Correct output: "Customer initiates payment -> System checks balance -> If suffi
 Wrong output: "It is a diagram with boxes and arrows."
 """
 
+# Analysis guidelines by task information type
+GUIDELINES = MappingProxyType({
+    "basic": BASIC_GUIDELINES,
+    "table": TABLE_GUIDELINES,
+    "chart": CHART_GUIDELINES,
+    "image": IMAGE_GUIDELINES
+})
+
 SYSTEM_DOCIA = """You are an AI assistant that answers questions by analyzing document images. Read text, tables, charts, and diagrams carefully. Always cite the document name and page number for every fact you use. Do not guess or add external knowledge."""
 
 SYSTEM_SYNTHESIS = """You combine multiple analysis results into one clear, complete answer. Use only the provided results. Do not mention sources, documents, or analysis steps. Write as if you naturally know the answer. Keep it concise."""
@@ -74,15 +84,10 @@ SYSTEM_ADAPTIVE_PLANNER = """You update task plans based on new findings. You ca
 
 SYSTEM_PAGE_SELECTOR = """You select document pages most relevant to the query. You analyze document summaries and page information to select the most relevant pages for answering specific questions using vision analysis."""
 
+# Guidelines and rules come before the per-task fields so the text after the
+# page images starts with a prefix shared by every task of the same type
 TASK_PROCESSING_PROMPT = """Complete this single task as part of a multi-step document analysis. Do not answer beyond the task scope.
 
-Task: {task_description}
-Type: {information_type}
-Search used: {search_queries}
-
-Previous context (if any):
-{memory_summary}
-
 Guidelines for this task:
 {analysis_guidelines}
 
@@ -97,6 +102,13 @@ Output format:
 - Then add supporting details with page/section references.
 - Keep total response under 200 words unless complex table/chart.
 
+Task: {task_description}
+Type: {information_type}
+Search used: {search_queries}
+
+Previous context (if any):
+{memory_summary}
+
 Begin analysis now."""
 
 SYNTHESIS_PROMPT = """Answer the user's question below using ONLY the provided analysis results. Do not add external knowledge.
@@ -117,7 +129,9 @@ Example bad response: "According to the Leadership document, the CEO is Jane Smi
 Now answer the user's question."""
 
 
-ADAPTIVE_INITIAL_PLANNING_PROMPT = """Create 1 to 3 tasks to answer the user query using RAG. Follow these rules strictly:
+# Static planning rules and examples, sent ahead of the per-query tail so the
+# provider can cache them as a prompt prefix
+ADAPTIVE_PLANNING_EXAMPLES = """Create 1 to 3 tasks to answer the user query using RAG. Follow these rules strictly:
 
 1. Create multiple tasks ONLY if they require fundamentally different information.
 2. Each task must be distinct — no overlapping or redundant tasks.
@@ -128,16 +142,16 @@ ADAPTIVE_INITIAL_PLANNING_PROMPT = """Create 1 to 3 tasks to answer the user que
 7. Never include the document ID in the task name or description.
 
 OUTPUT FORMAT — return ONLY raw JSON, no other text:
-{{
+{
   "tasks": [
-    {{
+    {
       "name": "...",
       "description": "...",
       "document": "doc_x",
       "information_type": "..."
-    }}
+    }
   ]
-}}
+}
 
 EXAMPLES — follow these formats exactly:
 
@@ -145,89 +159,92 @@ Query: "Who leads the AI team?"
 Available documents:
 doc_1: Leadership — executive bios, team structure
 Output:
-{{
+{
   "tasks": [
-    {{
+    {
       "name": "Find AI Team Lead",
       "description": "Locate the name and title of the AI team leader",
       "document": "doc_1",
       "information_type": "basic"
-    }}
+    }
   ]
-}}
+}
 
 Query: "Show Q2 sales by product category."
 Available documents:
 doc_1: Sales Report — product tables, regional breakdowns
 Output:
-{{
+{
   "tasks": [
-    {{
+    {
       "name": "Get Q2 Sales by Product",
       "description": "Extract sales figures per product category from tables",
       "document": "doc_1",
       "information_type": "table"
-    }}
+    }
   ]
-}}
+}
 
 Query: "How did user retention change last year?"
 Available documents:
 doc_1: Analytics — retention charts, monthly trends
 Output:
-{{
+{
   "tasks": [
-    {{
+    {
       "name": "Analyze Retention Trend",
       "description": "Describe user retention changes from chart data",
       "document": "doc_1",
       "information_type": "chart"
-    }}
+    }
   ]
-}}
+}
 
 Query: "Explain the data pipeline architecture."
 Available documents:
 doc_1: Tech Docs — system diagrams, component flows
 Output:
-{{
+{
   "tasks": [
-    {{
+    {
       "name": "Get Pipeline Diagram",
       "description": "Explain data flow from architecture diagram",
       "document": "doc_1",
       "information_type": "image"
-    }}
+    }
   ]
-}}
+}
 
 Query: "What is the WFH policy and how to request equipment?"
 Available documents:
 doc_1: HR Policy — remote rules, approval steps
 doc_2: IT Guide — equipment table, request form images
 Output:
-{{
+{
   "tasks": [
-    {{
+    {
       "name": "Get WFH Policy",
       "description": "Retrieve remote work rules and approval process",
       "document": "doc_1",
       "information_type": "basic"
-    }},
-    {{
+    },
+    {
       "name": "Get Equipment Request",
       "description": "Find how to request gear from IT guide",
       "document": "doc_2",
       "information_type": "image"
-    }}
+    }
   ]
-}}
-
----
-User query: {query}
+}"""
 
+# The knowledge base changes less often than the query, so it is cached after
+# the examples and the query comes last
+ADAPTIVE_PLANNING_DOCUMENTS = """---
 Available documents:
-{documents}
+{documents}"""
+
+ADAPTIVE_PLANNING_TAIL = """---
+User query: {query}
 
 ---
 
@@ -8,6 +8,7 @@ import logging
 from ...integrations.base import BaseProvider
 from ...exceptions import QueryClassificationError
 from ...core.utils import sanitize_llm_json
+from ...utils.json_helpers import json_loads
 from ..prompts import QUERY_CLASSIFICATION_PROMPT, SYSTEM_QUERY_CLASSIFIER
 
 logger = logging.getLogger(__name__)
@@ -55,7 +56,8 @@ class QueryClassifier:
             response = await self.provider.process_text_messages(
                 messages=messages_for_api,
                 max_tokens=1024,
-                temperature=0.1
+                temperature=0.1,
+                json_mode=True
             )
 
             if response is None:
@@ -64,7 +66,7 @@ class QueryClassifier:
 
             # Parse JSON response
             try:
-                result = json.loads(sanitize_llm_json(response))
+                result = json_loads(sanitize_llm_json(response))
 
                 # Validate required fields
                 if "reasoning" not in result or "needs_documents" not in result:
@@ -8,6 +8,7 @@ import logging
 from ...integrations.base import BaseProvider
 from ...exceptions import QueryReformulationError
 from ...core.utils import sanitize_llm_json
+from ...utils.json_helpers import json_loads
 from ..prompts import QUERY_REFORMULATION_PROMPT, SYSTEM_QUERY_REFORMULATOR
 
 logger = logging.getLogger(__name__)
@@ -61,7 +62,8 @@ class QueryReformulator:
             response = await self.provider.process_text_messages(
                 messages=messages_for_api,
                 max_tokens=8192,
-                temperature=0.2
+                temperature=0.2,
+                json_mode=True
             )
 
             if response is None:
@@ -71,7 +73,7 @@ class QueryReformulator:
             # Parse JSON response
             result = None
             try:
-                result = json.loads(sanitize_llm_json(response))
+                result = json_loads(sanitize_llm_json(response))
                 reformulated = result.get("reformulated_query", current_query)
 
                 logger.info(f"Query reformulation: '{current_query}' → '{reformulated}'")
@@ -8,10 +8,11 @@ import logging
 from typing import List, Dict, Any, Optional
 
 from ...models.document import Page
-from ...integrations.base import BaseProvider
+from ...integrations.base import BaseProvider, CACHE_CONTROL
 from ...core.config import DociaConfig
 from ...exceptions import PageSelectionError
 from ...core.utils import sanitize_llm_json
+from ...utils.json_helpers import json_loads
 from ..prompts import SYSTEM_PAGE_SELECTOR, VISION_PAGE_SELECTION_PROMPT
 
 logger = logging.getLogger(__name__)
@@ -60,7 +61,8 @@ class PageSelector:
             result = await self.provider.process_multimodal_messages(
                 messages=messages,
                 max_tokens=200,
-                temperature=0.1  # Low temperature for consistent selection
+                temperature=0.1,  # Low temperature for consistent selection
+                json_mode=True
             )
 
             if result is None:
@@ -107,6 +109,9 @@ class PageSelector:
                     "text": f"[Page {i}]"
                 }
             ])
+        if user_content:
+            # Selections over the same document can reuse the provider's cache of this prefix
+            user_content[-1]["cache_control"] = CACHE_CONTROL
 
         user_content.append(
             {
@@ -134,7 +139,7 @@ class PageSelector:
         """
         try:
             # Parse JSON response
-            selection_data = json.loads(sanitize_llm_json(result))
+            selection_data = json_loads(sanitize_llm_json(result))
             selected_indices = selection_data.get("selected_pages", [])
 
             selected_pages = []
@@ -6,17 +6,21 @@ Creates and dynamically updates task plans based on orchestrator findings
 import json
 import uuid
 import logging
-from typing import List, Optional
+from typing import List, Optional, Union
 
 from ...models.agent import AgentTask, TaskPlan, TaskResult, TaskStatus
 from ...models.document import Document
-from ...integrations.base import BaseProvider
+from ...integrations.base import BaseProvider, CACHE_CONTROL
 from ...exceptions import TaskPlanningError
 from ...core.utils import sanitize_llm_json
+from ...utils.json_helpers import json_loads
 from ..prompts import (
-    ADAPTIVE_INITIAL_PLANNING_PROMPT,
+    ADAPTIVE_PLANNING_EXAMPLES,
+    ADAPTIVE_PLANNING_DOCUMENTS,
+    ADAPTIVE_PLANNING_TAIL,
     ADAPTIVE_PLAN_UPDATE_PROMPT,
-    SYSTEM_ADAPTIVE_PLANNER
+    SYSTEM_ADAPTIVE_PLANNER,
+    GUIDELINES
 )
 
 logger = logging.getLogger(__name__)
@@ -52,32 +56,28 @@ class Planner:
         try:
             logger.info(f"Creating initial task plan for query: {query[:50]}...")
 
-            # Build context about available documents with full summaries
-            documents_text = ""
-            if documents:
-                doc_list = []
-                for doc in documents:
-                    summary = doc.summary or f"Document with {len(doc.pages)} pages"
-                    doc_list.append(f"{doc.id}: {doc.name}\nSummary: {summary}")
-                documents_text = "\n\n".join(doc_list)
-            else:
-                documents_text = "No documents available"
-
             # Generate initial plan
-            prompt = ADAPTIVE_INITIAL_PLANNING_PROMPT.format(
-                query=query,
-                documents=documents_text
+            prompt = ADAPTIVE_PLANNING_TAIL.format(query=query)
+            documents_text = ADAPTIVE_PLANNING_DOCUMENTS.format(
+                documents=self._build_documents_text(documents)
             )
 
+            # Static rules and examples, then the document list, form cacheable
+            # prefixes ahead of the per-query tail
             messages = [
-                {"role": "system", "content": SYSTEM_ADAPTIVE_PLANNER},
+                {"role": "system", "content": [
+                    {"type": "text", "text": SYSTEM_ADAPTIVE_PLANNER},
+                    {"type": "text", "text": ADAPTIVE_PLANNING_EXAMPLES, "cache_control": CACHE_CONTROL},
+                    {"type": "text", "text": documents_text, "cache_control": CACHE_CONTROL}
+                ]},
                 {"role": "user", "content": prompt}
             ]
 
             result = await self.provider.process_text_messages(
                 messages=messages,
                 max_tokens=8192,
-                temperature=0.3
+                temperature=0.3,
+                json_mode=True
             )
 
             if result is None:
@@ -100,7 +100,7 @@ class Planner:
     async def update_plan(
         self,
         current_plan: TaskPlan,
-        latest_result: TaskResult,
+        latest_result: Union[TaskResult, List[TaskResult]],
         original_query: str,
         documents: Optional[List[Document]] = None
     ) -> TaskPlan:
@@ -110,7 +110,8 @@ class Planner:
 
         Args:
             current_plan: Current task plan
-            latest_result: Result from the task just completed
+            latest_result: Result from the task just completed, or the results
+                of a batch of tasks completed together
             original_query: Original user query for context
             documents: Available documents (for new task assignments)
 
@@ -118,8 +119,11 @@ class Planner:
             Updated task plan (may have added/removed/modified tasks)
         """
         result = None
+        latest_results = latest_result if isinstance(latest_result, list) else [latest_result]
+        latest_result = latest_results[-1]
+        completed_task_name = ", ".join(r.task.name for r in latest_results)
         try:
-            logger.info(f"Updating task plan after completing: {latest_result.task.name}")
+            logger.info(f"Updating task plan after completing: {completed_task_name}")
 
             # Build current plan status
             plan_status = self._build_plan_status(current_plan)
@@ -127,24 +131,13 @@ class Planner:
             # Build progress summary from completed tasks
             progress_summary = self._build_progress_summary(current_plan, latest_result)
 
-            # Build available documents text with full summaries
-            available_documents = ""
-            if documents:
-                doc_list = []
-                for doc in documents:
-                    summary = doc.summary or f"Document with {len(doc.pages)} pages"
-                    doc_list.append(f"{doc.id}: {doc.name}\nSummary: {summary}")
-                available_documents = "\n\n".join(doc_list)
-            else:
-                available_documents = "No documents available"
-
             # Ask agent to evaluate and update plan
             prompt = ADAPTIVE_PLAN_UPDATE_PROMPT.format(
                 original_query=original_query,
-                available_documents=available_documents,
+                available_documents=self._build_documents_text(documents),
                 current_plan_status=plan_status,
-                completed_task_name=latest_result.task.name,
-                task_findings=latest_result.analysis,
+                completed_task_name=completed_task_name,
+                task_findings=self._build_task_findings(latest_results),
                 progress_summary=progress_summary
             )
 
@@ -156,7 +149,8 @@ class Planner:
             result = await self.provider.process_text_messages(
                 messages=messages,
                 max_tokens=8192,
-                temperature=0.3
+                temperature=0.3,
+                json_mode=True
             )
 
             if result is None:
@@ -176,7 +170,7 @@ class Planner:
     def _parse_initial_plan(self, result: str, query: str, documents: Optional[List[Document]] = None) -> TaskPlan:
         """Parse initial planning response and create TaskPlan with document assignments"""
         try:
-            plan_data = json.loads(sanitize_llm_json(result))
+            plan_data = json_loads(sanitize_llm_json(result))
             tasks = []
 
             # Create map of available document IDs for validation
@@ -191,7 +185,7 @@ class Planner:
 
                 # Parse information type with validation
                 info_type = task_data.get("information_type", "basic")
-                if info_type not in ["basic", "table", "chart", "image"]:
+                if info_type not in GUIDELINES:
                     info_type = "basic"  # Default to basic if invalid
 
                 task = AgentTask(
@@ -227,7 +221,7 @@ class Planner:
     ) -> TaskPlan:
         """Apply updates to the current plan based on agent's decision"""
         try:
-            update_data = json.loads(sanitize_llm_json(update_result))
+            update_data = json_loads(sanitize_llm_json(update_result))
             action = update_data.get("action", "continue")
             reason = update_data.get("reason", "No reason provided")
 
@@ -243,7 +237,7 @@ class Planner:
                 for task_data in new_tasks_data:
                     assigned_doc = task_data.get("document", "")
                     info_type = task_data.get("information_type", "basic")
-                    if info_type not in ["basic", "table", "chart", "image"]:
+                    if info_type not in GUIDELINES:
                         info_type = "basic"
 
                     new_task = AgentTask(
@@ -284,6 +278,17 @@ class Planner:
             logger.error(f"Failed to parse plan updates: {e}")
             raise TaskPlanningError(f"Failed to parse plan update JSON: {e}")
 
+    def _build_documents_text(self, documents: Optional[List[Document]]) -> str:
+        """List available documents with full summaries, ordered by ID so the text is stable across calls"""
+        if not documents:
+            return "No documents available"
+
+        doc_list = []
+        for doc in sorted(documents, key=lambda d: d.id):
+            summary = doc.summary or f"Document with {len(doc.pages)} pages"
+            doc_list.append(f"{doc.id}: {doc.name}\nSummary: {summary}")
+        return "\n\n".join(doc_list)
+
     def _build_plan_status(self, plan: TaskPlan) -> str:
         """Build text summary of current plan status"""
         status_lines = []
@@ -291,6 +296,12 @@ class Planner:
             status_lines.append(f"- {task.name}: {task.status.value}")
         return "\n".join(status_lines)
 
+    def _build_task_findings(self, results: List[TaskResult]) -> str:
+        """Combine the findings of the tasks completed since the last plan update"""
+        if len(results) == 1:
+            return results[0].analysis
+        return "\n\n".join(f"[{r.task.name}]\n{r.analysis}" for r in results)
+
     def _build_progress_summary(self, plan: TaskPlan, latest_result: TaskResult) -> str:
         """Build summary of progress so far"""
         completed_tasks = plan.get_completed_tasks()
@@ -4,7 +4,7 @@ Combines multiple task results into coherent final answers
 """
 
 import logging
-from typing import List
+from typing import List, Optional, Callable, Awaitable
 
 from ...models.agent import TaskResult
 from ...integrations.base import BaseProvider
@@ -25,7 +25,8 @@ class ResponseSynthesizer:
     async def synthesize_response(
         self,
         original_query: str,
-        task_results: List[TaskResult]
+        task_results: List[TaskResult],
+        on_chunk: Optional[Callable[[str], Awaitable[None]]] = None
     ) -> str:
         """
         Synthesize multiple task results into a final comprehensive response
@@ -33,6 +34,7 @@ class ResponseSynthesizer:
         Args:
             original_query: The user's original question
             task_results: List of completed task results to combine
+            on_chunk: Optional coroutine called with each piece of the answer as it is generated
 
         Returns:
             Synthesized response that addresses the original query
@@ -58,12 +60,23 @@ class ResponseSynthesizer:
                 {"role": "user", "content": prompt}
             ]
 
-            # Get synthesized response
-            result = await self.provider.process_text_messages(
-                messages=messages,
-                max_tokens=2048,  # Longer response for synthesis
-                temperature=0.2  # Low temperature for consistent synthesis
-            )
+            # Get synthesized response, streaming it out when a consumer is attached
+            if on_chunk is None:
+                result = await self.provider.process_text_messages(
+                    messages=messages,
+                    max_tokens=2048,  # Longer response for synthesis
+                    temperature=0.2  # Low temperature for consistent synthesis
+                )
+            else:
+                parts = []
+                async for chunk in self.provider.process_text_messages_stream(
+                    messages=messages,
+                    max_tokens=2048,
+                    temperature=0.2
+                ):
+                    parts.append(chunk)
+                    await on_chunk(chunk)
+                result = "".join(parts) if parts else None
 
             if result is None:
                 logger.error("Synthesizer received None from provider")
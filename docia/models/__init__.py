@@ -1,11 +1,22 @@
 """Document and agent models for Docia Intelligence Engine"""
 
-from .document import Document, Page, QueryResult, QueryMode
-from .agent import (
-    ConversationMessage, TaskPlan, TaskResult, AgentQueryResult, TaskStatus, AgentTask
-)
-
-__all__ = [
-    "Document", "Page", "QueryResult", "QueryMode",
-    "ConversationMessage", "TaskPlan", "TaskResult", "AgentQueryResult", "TaskStatus", "AgentTask"
-]
\ No newline at end of file
+from ..utils.lazy import lazy_exports
+
+# Loaded on first access so that importing docia.models.document doesn't also
+# load the agent models
+_LAZY_ATTRS = {
+    "Document": ".document",
+    "Page": ".document",
+    "QueryResult": ".document",
+    "QueryMode": ".document",
+    "ConversationMessage": ".agent",
+    "TaskPlan": ".agent",
+    "TaskResult": ".agent",
+    "AgentQueryResult": ".agent",
+    "TaskStatus": ".agent",
+    "AgentTask": ".agent",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_ATTRS)
+
+__all__ = list(_LAZY_ATTRS)
@@ -4,14 +4,34 @@ Docia Document Intelligence Models
 Core data structures for VisionLM-powered document understanding.
 """
 
-from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional
+from collections import defaultdict
+from dataclasses import dataclass, field, fields
+from typing import List, Dict, Any, Optional, Tuple
 from enum import Enum
 from pathlib import Path
-import uuid
 from datetime import datetime
 
 
+def _slotted(cls=None, *, extra_slots: Tuple[str, ...] = ()):
+    """Recreate a dataclass with __slots__ (dataclass(slots=True) needs Python 3.10)
+
+    Pages in particular exist by the thousand across a corpus; slots drop the
+    per-instance __dict__. extra_slots hold private state that isn't a field.
+    """
+    if cls is None:
+        return lambda cls: _slotted(cls, extra_slots=extra_slots)
+
+    field_names = tuple(f.name for f in fields(cls))
+    cls_dict = dict(cls.__dict__)
+    cls_dict["__slots__"] = field_names + extra_slots
+    for name in field_names:
+        # Defaults live on in the generated __init__; class attributes would clash with the slots
+        cls_dict.pop(name, None)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+    return type(cls)(cls.__name__, cls.__bases__, cls_dict)
+
+
 class QueryMode(str, Enum):
     """Docia Intelligence Processing Modes"""
     AUTO = "auto"    # Adaptive Vision AI processing
@@ -25,6 +45,7 @@ class DocumentStatus(str, Enum):
     FAILED = "failed"          # Intelligence processing failed
 
 
+@_slotted
 @dataclass
 class Page:
     """Document Page Intelligence Unit"""
@@ -42,6 +63,7 @@ class Page:
             raise ValueError("Image path is required")
 
 
+@_slotted(extra_slots=("_page_index",))
 @dataclass
 class Document:
     """Document Intelligence Container"""
@@ -56,11 +78,18 @@ class Document:
     def __post_init__(self):
         """Initialize intelligence container"""
         if not self.id:
+            import uuid
             self.id = str(uuid.uuid4())
         if not self.name:
             raise ValueError("Document name is required")
         if not isinstance(self.pages, list):
             raise ValueError("Pages must be a list")
+        self._page_index: Optional[Dict[int, int]] = None
+
+    def _index_pages(self) -> Dict[int, int]:
+        """Map page numbers to list positions, keeping the first page for a repeated number"""
+        self._page_index = {p.page_number: i for i, p in reversed(list(enumerate(self.pages)))}
+        return self._page_index
     
     @property
     def page_count(self) -> int:
@@ -69,16 +98,25 @@ class Document:
 
     def get_page(self, page_number: int) -> Optional[Page]:
         """Retrieve page intelligence by number"""
-        for page in self.pages:
-            if page.page_number == page_number:
-                return page
-        return None
+        # Pages is a public list that callers may edit in place, so an index hit is
+        # checked against the list and any mismatch or miss re-indexes it first
+        index = self._page_index
+        if index is not None:
+            position = index.get(page_number)
+            if position is not None and position < len(self.pages):
+                page = self.pages[position]
+                if page.page_number == page_number:
+                    return page
+
+        position = self._index_pages().get(page_number)
+        return None if position is None else self.pages[position]
     
     def get_pages_range(self, start: int, end: int) -> List[Page]:
         """Retrieve page intelligence in specified range"""
         return [p for p in self.pages if start <= p.page_number <= end]
 
 
+@_slotted
 @dataclass
 class QueryResult:
     """Docia Intelligence Query Response"""
@@ -112,20 +150,18 @@ class QueryResult:
 
     def get_pages_by_document(self) -> Dict[str, List[int]]:
         """Group intelligence sources by document"""
-        pages_by_doc = {}
+        pages_by_doc = defaultdict(list)
         for page in self.selected_pages:
-            doc_name = page.document_name or "Unknown Document"
-            if doc_name not in pages_by_doc:
-                pages_by_doc[doc_name] = []
-            pages_by_doc[doc_name].append(page.page_number)
-        
+            pages_by_doc[page.document_name or "Unknown Document"].append(page.page_number)
+
         # Sort intelligence sources numerically
-        for doc_name in pages_by_doc:
-            pages_by_doc[doc_name].sort()
+        for page_numbers in pages_by_doc.values():
+            page_numbers.sort()
 
-        return pages_by_doc
+        return dict(pages_by_doc)
 
 
+@_slotted
 @dataclass
 class DocumentProcessRequest:
     """Document Intelligence Processing Request"""
@@ -144,9 +180,11 @@ class DocumentProcessRequest:
 
         # Generate unique intelligence identifier
         if not self.document_id:
+            import uuid
             self.document_id = str(uuid.uuid4())
 
 
+@_slotted
 @dataclass
 class QueryRequest:
     """Docia Intelligence Query Request"""
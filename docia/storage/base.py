@@ -3,7 +3,7 @@ Base storage interface for documents
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, AsyncIterator
 import logging
 
 from ..models.document import Document, Page
@@ -146,7 +146,7 @@ class BaseStorage(ABC):
     async def search_documents(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
         """
         Simple text search in document names and summaries
-        Default implementation - subclasses can override for better search
+        Default implementation - filters list_documents, so results keep its order
         
         Args:
             query: Search query
@@ -155,21 +155,41 @@ class BaseStorage(ABC):
         Returns:
             List of matching document metadata
         """
-        all_docs = await self.list_documents()
-        matching_docs = []
         query_lower = query.lower()
+        matching_docs = [
+            doc_meta for doc_meta in await self.list_documents()
+            if self._matches_query(doc_meta, query_lower)
+        ]
+        return matching_docs[:limit]
+    
+    async def search_documents_stream(self, query: str, limit: int = 10) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield matching document metadata as soon as each match is found
+        Default implementation - filters list_documents, so results keep its order
         
-        for doc_meta in all_docs:
-            name_match = query_lower in doc_meta.get('name', '').lower()
-            summary_match = query_lower in doc_meta.get('summary', '').lower()
-            
-            if name_match or summary_match:
-                matching_docs.append(doc_meta)
+        Args:
+            query: Search query
+            limit: Maximum results
             
-            if len(matching_docs) >= limit:
-                break
+        Yields:
+            Matching document metadata dicts
+        """
+        query_lower = query.lower()
+        found = 0
         
-        return matching_docs
+        for doc_meta in await self.list_documents():
+            if self._matches_query(doc_meta, query_lower):
+                yield doc_meta
+                found += 1
+                if found >= limit:
+                    break
+    
+    @staticmethod
+    def _matches_query(doc_meta: Dict[str, Any], query_lower: str) -> bool:
+        """Check whether a lowercased query appears in a document's name or summary"""
+        name = doc_meta.get('name') or ''
+        summary = doc_meta.get('summary') or ''
+        return query_lower in name.lower() or query_lower in summary.lower()
     
     def get_storage_stats(self) -> Dict[str, Any]:
         """
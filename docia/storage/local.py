@@ -4,7 +4,6 @@ Adapted from production LocalStorage but simplified for open-source version
 """
 
 import os
-import json
 import shutil
 import asyncio
 from typing import List, Dict, Any, Optional
@@ -15,6 +14,7 @@ from datetime import datetime
 from .base import BaseStorage, StorageError
 from ..models.document import Document, Page
 from ..core.config import DociaConfig
+from ..utils.json_helpers import json_dumpb, json_loads
 
 logger = logging.getLogger(__name__)
 
@@ -24,8 +24,7 @@ class LocalStorage(BaseStorage):
     
     def __init__(self, config: DociaConfig):
         self.config = config
-        self.base_path = Path(config.local_storage_path)
-        self.base_path.mkdir(parents=True, exist_ok=True)
+        self.base_path = config.ensure_storage()
         logger.info(f"Initialized local storage at: {self.base_path}")
     
     def _doc_dir(self, document_id: str) -> Path:
@@ -40,6 +39,20 @@ class LocalStorage(BaseStorage):
         """Get pages directory path"""
         return self._doc_dir(document_id) / "pages"
     
+    @staticmethod
+    def _read_metadata(metadata_path: Path) -> Dict[str, Any]:
+        """Read a metadata file, parsing the raw bytes"""
+        with open(metadata_path, 'rb') as f:
+            return json_loads(f.read())
+
+    @staticmethod
+    def _write_metadata(metadata_path: Path, metadata: Dict[str, Any]):
+        """Write a metadata file through a temporary file and an atomic rename"""
+        tmp_path = metadata_path.with_name(metadata_path.name + ".tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(json_dumpb(metadata, indent=True))
+        os.replace(tmp_path, metadata_path)
+
     async def save_document(self, document: Document) -> str:
         """Save document to local storage"""
         try:
@@ -58,7 +71,7 @@ class LocalStorage(BaseStorage):
                     page_filename = f"page_{page.page_number:03d}.jpg"
                     dest_path = pages_dir / page_filename
                     
-                    await asyncio.get_event_loop().run_in_executor(
+                    await asyncio.get_running_loop().run_in_executor(
                         None, shutil.copy2, page.image_path, dest_path
                     )
                     
@@ -96,10 +109,10 @@ class LocalStorage(BaseStorage):
                 "updated_at": datetime.now().isoformat()
             }
             
-            # Save metadata
-            metadata_path = self._metadata_path(document.id)
-            with open(metadata_path, 'w') as f:
-                json.dump(metadata, f, indent=2)
+            # Save metadata in a single atomic write
+            await asyncio.get_running_loop().run_in_executor(
+                None, self._write_metadata, self._metadata_path(document.id), metadata
+            )
             
             logger.info(f"Saved document {document.id} with {len(stored_pages)} pages")
             return document.id
@@ -120,8 +133,7 @@ class LocalStorage(BaseStorage):
                 return None
             
             # Load metadata
-            with open(metadata_path, 'r') as f:
-                metadata = json.load(f)
+            metadata = self._read_metadata(metadata_path)
             
             # Reconstruct pages
             pages = []
@@ -151,6 +163,33 @@ class LocalStorage(BaseStorage):
             logger.error(f"Failed to load document {document_id}: {e}")
             raise StorageError(f"Failed to load document: {e}", document_id)
     
+    def _read_document_info(self, doc_dir: Path) -> Optional[Dict[str, Any]]:
+        """Read summary info for a document directory, or None if it holds no readable document"""
+        if not doc_dir.is_dir():
+            return None
+        
+        metadata_path = doc_dir / "metadata.json"
+        if not metadata_path.exists():
+            return None
+        
+        try:
+            metadata = self._read_metadata(metadata_path)
+            
+            # Return summary info
+            return {
+                'id': metadata['id'],
+                'name': metadata['name'],
+                'summary': metadata.get('summary'),
+                'page_count': metadata.get('page_count', 0),
+                'created_at': metadata['created_at'],
+                'updated_at': metadata.get('updated_at'),
+                'status': metadata.get('status', 'unknown')
+            }
+            
+        except Exception as e:
+            logger.warning(f"Failed to read metadata for {doc_dir.name}: {e}")
+            return None
+    
     async def list_documents(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """List all documents"""
         try:
@@ -160,32 +199,10 @@ class LocalStorage(BaseStorage):
                 return documents
             
             for doc_dir in self.base_path.iterdir():
-                if not doc_dir.is_dir():
-                    continue
-                
-                metadata_path = doc_dir / "metadata.json"
-                if not metadata_path.exists():
-                    continue
-                
-                try:
-                    with open(metadata_path, 'r') as f:
-                        metadata = json.load(f)
-                    
-                    # Return summary info
-                    doc_info = {
-                        'id': metadata['id'],
-                        'name': metadata['name'],
-                        'summary': metadata.get('summary'),
-                        'page_count': metadata.get('page_count', 0),
-                        'created_at': metadata['created_at'],
-                        'updated_at': metadata.get('updated_at'),
-                        'status': metadata.get('status', 'unknown')
-                    }
-                    documents.append(doc_info)
-                    
-                except Exception as e:
-                    logger.warning(f"Failed to read metadata for {doc_dir.name}: {e}")
+                doc_info = self._read_document_info(doc_dir)
+                if doc_info is None:
                     continue
+                documents.append(doc_info)
                 
                 if limit and len(documents) >= limit:
                     break
@@ -228,8 +245,7 @@ class LocalStorage(BaseStorage):
             if not metadata_path.exists():
                 return None
             
-            with open(metadata_path, 'r') as f:
-                metadata = json.load(f)
+            metadata = self._read_metadata(metadata_path)
             
             return metadata.get('summary')
             
@@ -245,16 +261,14 @@ class LocalStorage(BaseStorage):
                 return False
             
             # Load existing metadata
-            with open(metadata_path, 'r') as f:
-                metadata = json.load(f)
+            metadata = self._read_metadata(metadata_path)
             
             # Update summary and timestamp
             metadata['summary'] = summary
             metadata['updated_at'] = datetime.now().isoformat()
             
             # Save updated metadata
-            with open(metadata_path, 'w') as f:
-                json.dump(metadata, f, indent=2)
+            self._write_metadata(metadata_path, metadata)
             
             logger.info(f"Updated summary for document {document_id}")
             return True
@@ -3,7 +3,7 @@ In-memory storage backend for testing
 """
 
 import asyncio
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, AsyncIterator
 from datetime import datetime
 import logging
 import copy
@@ -166,6 +166,11 @@ class InMemoryStorage(BaseStorage):
             logger.error(f"Failed to search documents in memory: {e}")
             return []
     
+    async def search_documents_stream(self, query: str, limit: int = 10) -> AsyncIterator[Dict[str, Any]]:
+        """Yield search results in relevance order"""
+        for doc_info in await self.search_documents(query, limit):
+            yield doc_info
+    
     def _calculate_relevance(self, query: str, document: Document, summary: str) -> float:
         """Calculate simple relevance score for search results"""
         score = 0.0
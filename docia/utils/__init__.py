@@ -1,8 +1,20 @@
 """Utility functions and helpers"""
 
-from .async_helpers import sync_wrapper, ensure_async
+from .lazy import lazy_exports
 
-__all__ = [
-    "sync_wrapper",
-    "ensure_async"
-]
\ No newline at end of file
+# Loaded on first access so that the CLI's import of json_helpers doesn't also
+# load asyncio
+_LAZY_ATTRS = {
+    "sync_wrapper": ".async_helpers",
+    "ensure_async": ".async_helpers",
+    "json_loads": ".json_helpers",
+    "json_dumps": ".json_helpers",
+    "json_dumpb": ".json_helpers",
+    "ingest_folder": ".folder_helpers",
+    "ingest_files": ".folder_helpers",
+    "list_folder_files": ".folder_helpers",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_ATTRS)
+
+__all__ = list(_LAZY_ATTRS)
@@ -3,12 +3,16 @@ Async/sync compatibility helpers
 """
 
 import asyncio
+import atexit
 import threading
 from typing import Any, Awaitable, TypeVar
 from functools import wraps
 
 T = TypeVar('T')
 
+# Per-thread event loop reused by sync_wrapper across calls
+_thread_state = threading.local()
+
 
 def sync_wrapper(coro: Awaitable[T]) -> T:
     """
@@ -21,8 +25,29 @@ def sync_wrapper(coro: Awaitable[T]) -> T:
         # We're in an async context, need to run in a new thread
         return _run_in_thread(coro)
     except RuntimeError:
-        # No running event loop, safe to use asyncio.run
-        return asyncio.run(coro)
+        # No running event loop, reuse this thread's shared loop
+        return _get_shared_loop().run_until_complete(coro)
+
+
+def _get_shared_loop() -> asyncio.AbstractEventLoop:
+    """Get the calling thread's shared event loop, creating it on first use"""
+    loop = getattr(_thread_state, "loop", None)
+    if loop is None or loop.is_closed():
+        loop = asyncio.new_event_loop()
+        _thread_state.loop = loop
+        if threading.current_thread() is threading.main_thread():
+            atexit.register(_close_loop, loop)
+    return loop
+
+
+def _close_loop(loop: asyncio.AbstractEventLoop):
+    """Finalize async generators and close a shared event loop"""
+    if loop.is_closed():
+        return
+    try:
+        loop.run_until_complete(loop.shutdown_asyncgens())
+    finally:
+        loop.close()
 
 
 def _run_in_thread(coro: Awaitable[T]) -> T:
@@ -0,0 +1,82 @@
+"""
+Folder ingestion helpers
+"""
+
+import asyncio
+import os
+from typing import Any, Callable, List, Optional, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..docia import Docia
+
+# File extensions picked up when a folder is ingested
+FOLDER_EXTENSIONS = frozenset({'.pdf', '.jpg', '.jpeg', '.png'})
+
+# Maximum number of documents ingested at once
+MAX_CONCURRENT_ADDS = 8
+
+
+def list_folder_files(folder_path: str) -> List[str]:
+    """List the supported files directly inside a folder"""
+    with os.scandir(folder_path) as it:
+        return [
+            entry.path for entry in it
+            if entry.is_file()
+            and os.path.splitext(entry.name)[1].lower() in FOLDER_EXTENSIONS
+        ]
+
+
+async def ingest_files(
+    docia_instance: "Docia",
+    file_paths: List[str],
+    max_concurrent: int = MAX_CONCURRENT_ADDS,
+    on_file_done: Optional[Callable[[str, Optional[Exception]], Any]] = None
+) -> Tuple[List[Any], List[Tuple[str, Exception]]]:
+    """
+    Add several documents concurrently
+
+    Args:
+        docia_instance: Docia engine the documents are added to
+        file_paths: Files to add
+        max_concurrent: Maximum number of documents processed at once
+        on_file_done: Optional callable invoked with (path, error) as each file finishes
+
+    Returns:
+        Tuple of (added documents, list of (path, error) for failed files)
+    """
+    semaphore = asyncio.Semaphore(max_concurrent)
+
+    async def add_one(path):
+        async with semaphore:
+            try:
+                return path, await docia_instance.add_document(path), None
+            except Exception as e:
+                return path, None, e
+
+    added = []
+    failed = []
+    for next_done in asyncio.as_completed([add_one(path) for path in file_paths]):
+        path, document, error = await next_done
+        if error is not None:
+            failed.append((path, error))
+        else:
+            added.append(document)
+        if on_file_done is not None:
+            on_file_done(path, error)
+
+    return added, failed
+
+
+async def ingest_folder(
+    docia_instance: "Docia",
+    folder_path: str,
+    max_concurrent: int = MAX_CONCURRENT_ADDS,
+    on_file_done: Optional[Callable[[str, Optional[Exception]], Any]] = None
+) -> Tuple[List[Any], List[Tuple[str, Exception]]]:
+    """Add every supported file in a folder; see ingest_files"""
+    return await ingest_files(docia_instance, list_folder_files(folder_path), max_concurrent, on_file_done)
+
+
+def folder_query_text(folder_path: str) -> str:
+    """Question asked about a freshly ingested folder"""
+    return f"Analyze all documents in the folder {os.path.basename(os.path.normpath(folder_path))}"
@@ -0,0 +1,37 @@
+"""
+JSON encode/decode helpers
+
+Uses orjson when it is installed and falls back to the standard library.
+"""
+
+from typing import Any, Union
+
+try:
+    import orjson
+
+    def json_loads(data: Union[str, bytes]) -> Any:
+        """Parse JSON text or bytes"""
+        return orjson.loads(data)
+
+    def json_dumps(obj: Any, indent: bool = False) -> str:
+        """Serialize an object to JSON text (two-space indented when requested)"""
+        return json_dumpb(obj, indent).decode('utf-8')
+
+    def json_dumpb(obj: Any, indent: bool = False) -> bytes:
+        """Serialize an object to UTF-8 encoded JSON bytes"""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+
+except ImportError:
+    import json
+
+    def json_loads(data: Union[str, bytes]) -> Any:
+        """Parse JSON text or bytes"""
+        return json.loads(data)
+
+    def json_dumps(obj: Any, indent: bool = False) -> str:
+        """Serialize an object to JSON text (two-space indented when requested)"""
+        return json.dumps(obj, indent=2 if indent else None)
+
+    def json_dumpb(obj: Any, indent: bool = False) -> bytes:
+        """Serialize an object to UTF-8 encoded JSON bytes"""
+        return json_dumps(obj, indent).encode('utf-8')
@@ -0,0 +1,39 @@
+"""
+Lazy package exports
+
+Lets a package's __init__ name its public attributes without importing the
+submodules that define them until they are first accessed (PEP 562).
+"""
+
+import importlib
+import sys
+from typing import Any, Callable, List, Mapping, Tuple
+
+
+def lazy_exports(
+    package: str,
+    attrs: Mapping[str, str]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Build a package's module-level __getattr__ and __dir__
+
+    Args:
+        package: The package's __name__
+        attrs: Public name -> relative submodule that defines it
+
+    Returns:
+        (__getattr__, __dir__) to assign in the package's __init__
+    """
+    def __getattr__(name: str) -> Any:
+        """Import a public attribute's submodule the first time it is requested"""
+        module_name = attrs.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module_name, package), name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package])) | set(attrs))
+
+    return __getattr__, __dir__
@@ -48,6 +48,15 @@ setup(
             "flake8>=6.0.0",
             "mypy>=1.0.0",
         ],
+        "speed": [
+            "uvloop>=0.17.0; sys_platform != 'win32'",
+            "orjson>=3.9.0",
+            "pybase64>=1.3.0",
+            "h2>=4.1.0",
+        ],
+        "shell": [
+            "prompt_toolkit>=3.0.0",
+        ],
     },
     entry_points={
         "console_scripts": [
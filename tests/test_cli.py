@@ -0,0 +1,28 @@
+"""Tests for the Docia CLI entry point"""
+
+import pytest
+from click.testing import CliRunner
+
+from cli.main import docia
+
+
+@pytest.fixture
+def runner(monkeypatch, tmp_path):
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    monkeypatch.delenv("OPENROUTER_API_KEY", raising=False)
+    monkeypatch.chdir(tmp_path)
+    return CliRunner()
+
+
+def test_subcommand_help_runs_without_api_key(runner):
+    result = runner.invoke(docia, ["list", "--help"])
+
+    assert result.exit_code == 0
+    assert "List all documents" in result.output
+
+
+def test_subcommand_without_api_key_fails_initialization(runner):
+    result = runner.invoke(docia, ["list"])
+
+    assert result.exit_code == 1
+    assert "Initialization failed" in result.output
@@ -0,0 +1,45 @@
+"""Tests for the local file system storage backend"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from docia.core.config import DociaConfig
+from docia.models.document import Document
+from docia.storage.local import LocalStorage
+
+
+@pytest.fixture
+def storage(tmp_path):
+    return LocalStorage(DociaConfig(openrouter_api_key="test-key", local_storage_path=str(tmp_path)))
+
+
+async def save_reports(storage, count):
+    """Save documents named report-0..report-N, each a day newer than the last"""
+    start = datetime(2024, 1, 1)
+    for i in range(count):
+        await storage.save_document(Document(
+            id=f"doc-{i}",
+            name=f"report-{i}",
+            pages=[],
+            created_at=start + timedelta(days=i)
+        ))
+    await storage.save_document(Document(id="other", name="invoice", pages=[], created_at=start + timedelta(days=count)))
+
+
+@pytest.mark.asyncio
+async def test_search_stream_yields_newest_matches_within_limit(storage):
+    await save_reports(storage, 5)
+
+    results = [doc async for doc in storage.search_documents_stream("report", limit=3)]
+
+    assert [doc["id"] for doc in results] == ["doc-4", "doc-3", "doc-2"]
+
+
+@pytest.mark.asyncio
+async def test_search_stream_matches_search_documents(storage):
+    await save_reports(storage, 5)
+
+    streamed = [doc async for doc in storage.search_documents_stream("report", limit=2)]
+
+    assert streamed == await storage.search_documents("report", limit=2)
@@ -0,0 +1,95 @@
+"""Tests for the adaptive plan execution in the orchestrator"""
+
+import json
+
+import pytest
+
+from docia.core.config import DociaConfig
+from docia.integrations.base import BaseProvider
+from docia.intelligence import prompts
+from docia.intelligence.orchestrator import Orchestrator
+from docia.models.document import Document, Page
+
+
+class FakeProvider(BaseProvider):
+    """Provider that answers each prompt type with a fixed response and records the calls"""
+
+    def __init__(self, config: DociaConfig, plan_update: dict):
+        super().__init__(config)
+        self.plan_update = plan_update
+        self.calls = []
+
+    async def process_text_messages(self, messages, max_tokens=512, temperature=0.1, json_mode=False):
+        system = messages[0]["content"]
+        if isinstance(system, list):
+            self.calls.append("plan")
+            return json.dumps({"tasks": [
+                {"name": "Totals", "description": "Find the totals", "document": "d1"},
+                {"name": "Dates", "description": "Find the dates", "document": "d1"},
+            ]})
+        if system == prompts.SYSTEM_QUERY_CLASSIFIER:
+            self.calls.append("classify")
+            return json.dumps({"reasoning": "r", "needs_documents": True})
+        if system == prompts.SYSTEM_ADAPTIVE_PLANNER:
+            self.calls.append("update")
+            return json.dumps(self.plan_update)
+        self.calls.append("synthesize")
+        return "answer"
+
+    async def process_text_messages_stream(self, messages, max_tokens=512, temperature=0.1):
+        yield await self.process_text_messages(messages)
+
+    async def process_multimodal_messages(self, messages, max_tokens=512, temperature=0.1, json_mode=False):
+        if messages[0]["content"] == prompts.SYSTEM_PAGE_SELECTOR:
+            self.calls.append("select")
+            return json.dumps({"selected_pages": [1]})
+        self.calls.append("analyze")
+        return "analysis"
+
+
+class FakeStorage:
+    def __init__(self):
+        self.documents = [Document(id="d1", name="report", pages=[
+            Page(page_number=1, image_path="/tmp/p1.jpg"),
+            Page(page_number=2, image_path="/tmp/p2.jpg"),
+        ])]
+
+    async def get_all_documents(self):
+        return self.documents
+
+
+def make_orchestrator(plan_update: dict, **config_overrides):
+    config = DociaConfig(openrouter_api_key="test-key", **config_overrides)
+    provider = FakeProvider(config, plan_update)
+    return Orchestrator(provider, FakeStorage(), config), provider
+
+
+@pytest.mark.asyncio
+async def test_plan_is_updated_when_budget_remains():
+    orchestrator, provider = make_orchestrator({"action": "continue", "reason": "enough"})
+
+    result = await orchestrator.process_query("When was the total paid?")
+
+    assert result.answer == "answer"
+    assert len(result.task_results) == 2
+    assert provider.calls.count("update") == 1
+    assert provider.calls.index("update") < provider.calls.index("synthesize")
+
+
+@pytest.mark.asyncio
+async def test_tasks_added_by_plan_update_are_executed():
+    orchestrator, provider = make_orchestrator({
+        "action": "add_tasks",
+        "reason": "need more",
+        "new_tasks": [{"name": "Payer", "description": "Find the payer", "document": "d1"}],
+    }, max_agent_iterations=3)
+    events = []
+
+    async def callback(event_type, data):
+        events.append(event_type)
+
+    result = await orchestrator.process_query("Who paid the total?", task_update_callback=callback)
+
+    assert [r.task.name for r in result.task_results] == ["Totals", "Dates", "Payer"]
+    assert result.total_iterations == 3
+    assert "plan_updated" in events